@@ -5,19 +5,25 @@ Simplified version with prioritized LLM voting
 
 from fastapi import FastAPI, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import StreamingResponse
 from fastapi.staticfiles import StaticFiles
+from contextlib import asynccontextmanager
 from pydantic import BaseModel
-from typing import List, Dict, Any, Optional
+from typing import Iterator, List, Dict, Any, Optional, Tuple
 import os
-import json
+import time
+import asyncio
+import orjson
+import threading
 from pathlib import Path
 from datetime import datetime
 
 from real_llm_services import (
-    get_target_response,
-    extract_claims_with_llm,
+    aget_target_response,
+    aextract_claims_with_llm,
+    aclose_clients,
 )
-from prioritized_voting import verify_with_prioritized_voting
+from prioritized_voting import averify_with_prioritized_voting
 from models import ClaimVerification
 from metrics_calculator import MetricsCalculator
 
@@ -28,8 +34,36 @@ TARGET_MODEL_LABELS: Dict[str, str] = {
     "gemini": "gemini-1.5-flash",
     "deepseek": "deepseek-chat",
 }
+DEFAULT_TARGET_LABEL = TARGET_MODEL_LABELS["mistral"]
 
-app = FastAPI(title="Enhanced Hallucination Detection API", version="2.0.0")
+# /analyze has no external verification stage, so these ClaimVerification fields keep their defaults
+UNCHECKED_EXTERNAL_FIELDS: Dict[str, Any] = {
+    "wikipedia_status": None,
+    "wikipedia_summary": None,
+    "is_wikipedia_checked": False,
+}
+
+# Summary returned when no factual claims are extracted (target_model is filled per request)
+EMPTY_SUMMARY: Dict[str, Any] = {
+    "total_claims": 0,
+    "verified": 0,
+    "refuted": 0,
+    "uncertain": 0,
+    "extraction_model": "openai-gpt-4o-mini",
+}
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Provider clients are module-level and reused across requests; release their pools on shutdown
+    yield
+    await aclose_clients()
+
+
+app = FastAPI(
+    title="Enhanced Hallucination Detection API",
+    version="2.0.0",
+    lifespan=lifespan,
+)
 
 # Enable CORS for frontend
 app.add_middleware(
@@ -40,9 +74,46 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+
+class CachedStaticFiles(StaticFiles):
+    """
+    StaticFiles that remembers resolved paths for a few seconds, so the burst of
+    asset requests on page load does not re-resolve the same files over and over.
+    The file itself is still stat'ed on every request, so size and ETag stay current
+    """
+
+    def __init__(self, *args, cache_ttl: float = 5.0, cache_size: int = 256, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.cache_ttl = cache_ttl
+        self.cache_size = cache_size
+        self._lookup_cache: Dict[str, Tuple[float, str]] = {}
+        # Starlette calls lookup_path from worker threads
+        self._lookup_lock = threading.Lock()
+
+    def lookup_path(self, path: str) -> Tuple[str, Optional[os.stat_result]]:
+        now = time.monotonic()
+        cached = self._lookup_cache.get(path)
+        if cached is not None and cached[0] > now:
+            try:
+                return cached[1], os.stat(cached[1])
+            except OSError:
+                # Deleted or replaced - resolve it again below
+                with self._lookup_lock:
+                    self._lookup_cache.pop(path, None)
+
+        full_path, stat_result = super().lookup_path(path)
+        # Only cache files that exist, misses are cheap and would let clients fill the cache
+        if stat_result is not None:
+            with self._lookup_lock:
+                if path not in self._lookup_cache and len(self._lookup_cache) >= self.cache_size:
+                    self._lookup_cache.pop(next(iter(self._lookup_cache)))
+                self._lookup_cache[path] = (now + self.cache_ttl, full_path)
+        return full_path, stat_result
+
+
 # Serve the frontend for convenience
 frontend_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), "frontend")
-app.mount("/static", StaticFiles(directory=frontend_path), name="static")
+app.mount("/static", CachedStaticFiles(directory=frontend_path), name="static")
 
 
 class UserQuery(BaseModel):
@@ -58,86 +129,61 @@ class AnalysisResponse(BaseModel):
     confidence_analysis: Dict[str, Any]
 
 
-@app.get("/")
-async def root() -> Dict[str, str]:
-    return {"message": "Enhanced Hallucination Detection API is running"}
-
-
-@app.post("/analyze", response_model=AnalysisResponse)
-async def analyze_hallucination(query: UserQuery) -> AnalysisResponse:
-    try:
-        target_choice = (query.target_llm or "mistral").lower()
-        target_model_label = TARGET_MODEL_LABELS.get(target_choice, TARGET_MODEL_LABELS["mistral"])
-
-        # Step 1: Get response from the selected target LLM
-        llm_response = get_target_response(query.question, target_choice)
-
-        # Step 2: Extract factual claims using OpenAI
-        claims_text = extract_claims_with_llm(llm_response)
-
-        if not claims_text:
-            summary = {
-                "total_claims": 0,
-                "verified": 0,
-                "refuted": 0,
-                "uncertain": 0,
-                "extraction_model": "openai-gpt-4o-mini",
-                "target_model": target_model_label,
-            }
-            return AnalysisResponse(
-                original_question=query.question,
-                llm_response=llm_response,
-                claims=[],
-                summary=summary,
-                confidence_analysis={},
-            )
-
-        # Step 3: Verify claims with prioritized voting system
-        verification_results = verify_with_prioritized_voting(claims_text, target_choice)
-
-        verified_claims: List[ClaimVerification] = []
-        for index, result in enumerate(verification_results):
-            verified_claims.append(
-                ClaimVerification(
-                    id=f"C{index + 1}",
-                    claim=result["claim"],
-                    llm1_verification=result["llm1_result"],
-                    llm2_verification=result["llm2_result"],
-                    llm1_name=result["llm1_name"],
-                    llm2_name=result["llm2_name"],
-                    llm3_name=result["llm3_name"],
-                    llm3_verification=result["llm3_result"],
-                    voting_used=result["voting_used"],
-                    final_verdict=result["final_verdict"],
-                )
-            )
-
-        # Step 4: Collect verification LLM names used
-        verifier_llms = set()
-        # Count verdicts
+def stream_analysis(
+    query: UserQuery,
+    target_model_label: str,
+    llm_response: str,
+    verification_results: Optional[List[Dict[str, Any]]],
+    verifier_llms: List[str],
+) -> Iterator[bytes]:
+    """
+    Serialize an AnalysisResponse as incremental JSON: the target LLM answer is
+    written first, then each verified claim, then the summary. All LLM work is
+    done before streaming starts, so failures still surface as HTTP errors
+    """
+    yield (
+        b'{"original_question":' + orjson.dumps(query.question)
+        + b',"llm_response":' + orjson.dumps(llm_response)
+        + b',"claims":['
+    )
+
+    # None when no factual claims were extracted
+    if verification_results is None:
+        summary = {**EMPTY_SUMMARY, "target_model": target_model_label}
+    else:
+        # Claims are emitted as plain dicts in ClaimVerification's field layout;
+        # orjson serializes them directly without a model object per claim.
+        # Verdicts are counted in the same pass
         verified_count = 0
         refuted_count = 0
         uncertain_count = 0
-        
-        for claim in verified_claims:
-            if claim.llm1_name:
-                verifier_llms.add(claim.llm1_name)
-            if claim.llm2_name:
-                verifier_llms.add(claim.llm2_name)
-            if claim.llm3_name:
-                verifier_llms.add(claim.llm3_name)
-            
-            # Count based on final verdict
-            verdict = claim.final_verdict.lower() if claim.final_verdict else "uncertain"
+
+        for index, result in enumerate(verification_results):
+            claim = {
+                "id": f"C{index + 1}",
+                "claim": result["claim"],
+                "llm1_verification": result["llm1_result"],
+                "llm2_verification": result["llm2_result"],
+                "llm1_name": result["llm1_name"],
+                "llm2_name": result["llm2_name"],
+                "llm3_name": result["llm3_name"],
+                "llm3_verification": result["llm3_result"],
+                "voting_used": result["voting_used"],
+                "final_verdict": result["final_verdict"],
+                **UNCHECKED_EXTERNAL_FIELDS,
+            }
+            yield (b"," if index else b"") + orjson.dumps(claim)
+
+            verdict = claim["final_verdict"].lower() if claim["final_verdict"] else "uncertain"
             if verdict == "yes":
                 verified_count += 1
             elif verdict == "no":
                 refuted_count += 1
             else:
                 uncertain_count += 1
-        
+
         summary = {
-            "total_claims": len(verified_claims),
+            "total_claims": len(verification_results),
             "verified": verified_count,
             "refuted": refuted_count,
             "uncertain": uncertain_count,
@@ -147,17 +193,41 @@ async def analyze_hallucination(query: UserQuery) -> AnalysisResponse:
             "voting_enabled": True,
         }
 
-        return AnalysisResponse(
-            original_question=query.question,
-            llm_response=llm_response,
-            claims=verified_claims,
-            summary=summary,
-            confidence_analysis={},  # Empty, not used anymore
-        )
+    # confidence_analysis is kept empty, it is not used anymore
+    yield b'],"summary":' + orjson.dumps(summary) + b',"confidence_analysis":{}}'
+
+
+@app.get("/")
+async def root() -> Dict[str, str]:
+    return {"message": "Enhanced Hallucination Detection API is running"}
+
+
+@app.post("/analyze", response_model=AnalysisResponse)
+async def analyze_hallucination(query: UserQuery) -> StreamingResponse:
+    try:
+        target_choice = query.target_llm.casefold() if query.target_llm else "mistral"
+        target_model_label = TARGET_MODEL_LABELS.get(target_choice, DEFAULT_TARGET_LABEL)
+
+        # Step 1: Get response from the selected target LLM
+        llm_response = await aget_target_response(query.question, target_choice)
+
+        # Step 2: Extract factual claims using OpenAI
+        claims_text = await aextract_claims_with_llm(llm_response)
+
+        # Step 3: Verify claims with prioritized voting system
+        if claims_text:
+            verification_results, verifier_llms = await averify_with_prioritized_voting(claims_text, target_choice)
+        else:
+            verification_results, verifier_llms = None, []
 
     except Exception as exc:
         raise HTTPException(status_code=500, detail=f"Analysis failed: {exc}")
 
+    return StreamingResponse(
+        stream_analysis(query, target_model_label, llm_response, verification_results, verifier_llms),
+        media_type="application/json",
+    )
+
 
 @app.get("/health")
 async def health_check() -> Dict[str, str]:
@@ -172,6 +242,83 @@ async def health_check() -> Dict[str, str]:
 ANNOTATIONS_DIR = Path("data/annotations")
 ANNOTATIONS_DIR.mkdir(parents=True, exist_ok=True)
 
+# Characters of an ISO timestamp that are unsafe in annotation filenames
+TIMESTAMP_FILENAME_TABLE = str.maketrans(":.", "--")
+
+
+class AnnotationIndex:
+    """
+    Sorted listing of the annotation directory, rescanned only when the
+    directory's mtime changes (a file was added, removed or renamed)
+    """
+    
+    def __init__(self, directory: Path):
+        self.directory = directory
+        self._mtime_ns: Optional[int] = None
+        self._names: List[str] = []
+        # Bumped on every rescan, so results derived from the listing can be cached against it
+        self.generation = 0
+    
+    def invalidate(self) -> None:
+        """Force a rescan - mtime resolution can hide a write made in the same tick"""
+        self._mtime_ns = None
+    
+    def refresh(self) -> int:
+        """Rescan if the directory changed and return the current generation"""
+        mtime_ns = self.directory.stat().st_mtime_ns
+        if mtime_ns != self._mtime_ns:
+            with os.scandir(self.directory) as entries:
+                self._names = sorted(entry.name for entry in entries)
+            self._mtime_ns = mtime_ns
+            self.generation += 1
+        return self.generation
+    
+    def files(self, prefix: str, suffix: str = ".json") -> List[Path]:
+        """Same files, in the same order, as sorted(directory.glob(f"{prefix}*{suffix}"))"""
+        self.refresh()
+        min_length = len(prefix) + len(suffix)
+        return [
+            self.directory / name for name in self._names
+            if len(name) >= min_length and name.startswith(prefix) and name.endswith(suffix)
+        ]
+
+
+annotation_index = AnnotationIndex(ANNOTATIONS_DIR)
+
+# Last /api/evaluation-progress result and the index generation it was computed from
+_progress_cache: Dict[str, Any] = {}
+
+# Parsed annotation/prediction files by path: (mtime_ns, size, data)
+JSON_CACHE_SIZE = 512
+_json_cache: Dict[Path, Tuple[int, int, Dict[str, Any]]] = {}
+_json_cache_lock = threading.Lock()
+
+
+def write_json_file(path: Path, data: Dict[str, Any]) -> None:
+    """Write data as indented JSON (blocking - call through asyncio.to_thread)"""
+    path.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+    with _json_cache_lock:
+        _json_cache.pop(path, None)
+    annotation_index.invalidate()
+
+
+def read_json_file(path: Path) -> Dict[str, Any]:
+    """
+    Read a JSON file (blocking - call through asyncio.to_thread). Parsed files are
+    reused while their mtime and size are unchanged, so treat the result as read-only
+    """
+    stat = path.stat()
+    cached = _json_cache.get(path)
+    if cached is not None and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+        return cached[2]
+
+    data = orjson.loads(path.read_bytes())
+    with _json_cache_lock:
+        if path not in _json_cache and len(_json_cache) >= JSON_CACHE_SIZE:
+            _json_cache.pop(next(iter(_json_cache)))
+        _json_cache[path] = (stat.st_mtime_ns, stat.st_size, data)
+    return data
+
 
 @app.post("/api/save-annotation")
 async def save_annotation(request: Request):
@@ -198,7 +345,7 @@ async def save_annotation(request: Request):
             raise HTTPException(status_code=400, detail="Missing question_id or target_model")
         
         # Create filename with timestamp
-        safe_timestamp = timestamp.replace(':', '-').replace('.', '-')
+        safe_timestamp = timestamp.translate(TIMESTAMP_FILENAME_TABLE)
         filename = f"{target_model}_{question_id}_{safe_timestamp}.json"
         filepath = ANNOTATIONS_DIR / filename
         
@@ -212,8 +359,7 @@ async def save_annotation(request: Request):
             'annotated_by': 'manual'
         }
         
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(annotation_data, f, indent=2, ensure_ascii=False)
+        await asyncio.to_thread(write_json_file, filepath, annotation_data)
         
         return {
             "status": "success",
@@ -263,8 +409,7 @@ async def save_predictions(request: Request):
             'total_claims': len(predictions)
         }
         
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(prediction_data, f, indent=2, ensure_ascii=False)
+        await asyncio.to_thread(write_json_file, filepath, prediction_data)
         
         return {
             "status": "success",
@@ -297,8 +442,7 @@ async def calculate_metrics(request: Request):
             raise HTTPException(status_code=400, detail="Missing question_id or target_model")
         
         # Find the most recent annotation file
-        pattern = f"{target_model}_{question_id}_*.json"
-        annotation_files = sorted(ANNOTATIONS_DIR.glob(pattern))
+        annotation_files = annotation_index.files(f"{target_model}_{question_id}_")
         annotation_files = [f for f in annotation_files if not f.name.endswith('_predictions.json') 
                            and not f.name.endswith('_metrics.json')]
         
@@ -308,8 +452,7 @@ async def calculate_metrics(request: Request):
         latest_annotation = annotation_files[-1]
         
         # Load annotations
-        with open(latest_annotation, 'r', encoding='utf-8') as f:
-            annotation_data = json.load(f)
+        annotation_data = await asyncio.to_thread(read_json_file, latest_annotation)
         
         annotations = annotation_data['annotations']
         
@@ -319,8 +462,7 @@ async def calculate_metrics(request: Request):
         if not predictions_file.exists():
             raise HTTPException(status_code=404, detail="No predictions found for this question")
         
-        with open(predictions_file, 'r', encoding='utf-8') as f:
-            prediction_data = json.load(f)
+        prediction_data = await asyncio.to_thread(read_json_file, predictions_file)
         
         predictions = prediction_data['predictions']
         
@@ -339,8 +481,7 @@ async def calculate_metrics(request: Request):
         }
         
         metrics_file = ANNOTATIONS_DIR / f"{target_model}_{question_id}_metrics.json"
-        with open(metrics_file, 'w', encoding='utf-8') as f:
-            json.dump(metrics_data, f, indent=2, ensure_ascii=False)
+        await asyncio.to_thread(write_json_file, metrics_file, metrics_data)
         
         return {
             "status": "success",
@@ -363,13 +504,16 @@ async def get_aggregate_metrics(target_model: str):
         target_model: Name of the target model (e.g., "mistral", "openai")
     """
     try:
-        calculator = MetricsCalculator()
-        aggregate = calculator.aggregate_metrics(target_model, ANNOTATIONS_DIR)
-        
-        if 'error' in aggregate:
-            raise HTTPException(status_code=404, detail=aggregate['error'])
-        
-        return aggregate
+        metrics_files = annotation_index.files(f"{target_model}_", "_metrics.json")
+        if not metrics_files:
+            raise HTTPException(status_code=404, detail=f"No metrics found for model: {target_model}")
+        
+        # Unchanged files come from the parse cache, only new or rewritten ones are read
+        return await asyncio.to_thread(
+            MetricsCalculator.combine_metrics,
+            target_model,
+            (read_json_file(path)['metrics'] for path in metrics_files),
+        )
         
     except HTTPException:
         raise
@@ -385,13 +529,17 @@ async def get_evaluation_progress():
     Returns count of annotated questions per model
     """
     try:
+        # Progress only changes when files are added, so reuse it until the index rescans
+        generation = annotation_index.refresh()
+        if _progress_cache.get("generation") == generation:
+            return _progress_cache["result"]
+        
         models = ["mistral", "openai", "anthropic", "gemini", "deepseek"]
         progress = {}
         
         for model in models:
             # Count unique question IDs for this model
-            pattern = f"{model}_*_metrics.json"
-            metrics_files = list(ANNOTATIONS_DIR.glob(pattern))
+            metrics_files = annotation_index.files(f"{model}_", "_metrics.json")
             
             question_ids = set()
             for f in metrics_files:
@@ -409,7 +557,7 @@ async def get_evaluation_progress():
         total_completed = sum(p['completed'] for p in progress.values())
         total_required = 50 * len(models)  # 50 questions × 5 models = 250
         
-        return {
+        result = {
             'per_model': progress,
             'overall': {
                 'completed': total_completed,
@@ -417,6 +565,9 @@ async def get_evaluation_progress():
                 'percentage': (total_completed / total_required) * 100 if total_completed > 0 else 0
             }
         }
+        _progress_cache["generation"] = generation
+        _progress_cache["result"] = result
+        return result
         
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to get progress: {str(e)}")
@@ -424,5 +575,18 @@ async def get_evaluation_progress():
 
 if __name__ == "__main__":
     import uvicorn
-
-    uvicorn.run(app, host="0.0.0.0", port=8001)
+    from config import Config
+
+    # Print once here rather than on import in every worker
+    Config.log_status_once()
+
+    # Multiple workers need the import string; loop/http "auto" pick uvloop and
+    # httptools when uvicorn[standard] is installed
+    uvicorn.run(
+        "app:app",
+        host="0.0.0.0",
+        port=8001,
+        workers=Config.SERVER_WORKERS,
+        loop="auto",
+        http="auto",
+    )
@@ -3,7 +3,109 @@ Extract factual claims from LLM responses using rule-based NLP
 """
 
 import re
-from typing import List
+from typing import Iterable, List, Optional, Set
+
+try:
+    import hyperscan
+except ImportError:  # optional: falls back to the compiled Python patterns below
+    hyperscan = None
+
+# Sentence boundary: terminal punctuation followed by whitespace and a capital letter
+SENTENCE_SPLIT_RE = re.compile(r'(?<=[.!?])\s+(?=[A-Z])')
+
+# Sentences that are clearly not factual claims (matched case-insensitively)
+SKIP_PATTERNS = [
+    r'^(however|therefore|thus|hence|consequently)',
+    r'^(in conclusion|to summarize|in summary)',
+    r'^(i think|i believe|i feel|it seems|perhaps|maybe)',
+    r'\?$',  # Questions
+    r'^(let me|let us|we should|you should)',
+]
+
+# Factual claim indicators (matched case-insensitively, so no capitalization-based
+# patterns - those live in METADATA_PATTERNS, which are matched as written)
+FACTUAL_INDICATORS = [
+    # Dates and years
+    r'\b(19|20)\d{2}\b',
+    r'\b(january|february|march|april|may|june|july|august|september|october|november|december)\b',
+    
+    # Numbers and measurements
+    r'\b\d+(?:\.\d+)?\s*(years?|months?|days?|hours?|minutes?|seconds?)\b',
+    r'\b\d+(?:\.\d+)?\s*(degrees?|celsius|fahrenheit|km|miles?|meters?|feet)\b',
+    
+    # Specific verbs indicating facts
+    r'\b(was|were|is|are|born|died|created|invented|discovered|founded|established)\b',
+    r'\b(published|released|developed|wrote|served|became|graduated)\b',
+    
+    # Achievement/award indicators
+    r'\b(won|received|awarded|prize|nobel|award)\b',
+    
+    # Scientific/technical terms
+    r'\b(theory|law|principle|equation|formula|theorem)\b',
+]
+
+# Each list fused into a single alternation, so one regex pass replaces the per-pattern loop
+SKIP_RE = re.compile("|".join(f"(?:{pattern})" for pattern in SKIP_PATTERNS), re.IGNORECASE)
+FACTUAL_RE = re.compile("|".join(f"(?:{pattern})" for pattern in FACTUAL_INDICATORS), re.IGNORECASE)
+
+WHITESPACE_RE = re.compile(r'\s+')
+BOLD_RE = re.compile(r'\*\*(.*?)\*\*')
+ITALIC_RE = re.compile(r'\*(.*?)\*')
+CODE_RE = re.compile(r'`(.*?)`')
+
+YEAR_RE = re.compile(r'\b(19|20)\d{2}\b')
+FULL_NAME_RE = re.compile(r'\b[A-Z][a-z]+(?:\s+[A-Z][a-z]+)+\b')
+NUMBER_RE = re.compile(r'\b\d+(?:\.\d+)?\b')
+
+# Metadata flags checked against the cleaned claim text, in id order
+METADATA_PATTERNS = [
+    ("contains_date", YEAR_RE),
+    ("contains_name", FULL_NAME_RE),
+    ("contains_number", NUMBER_RE),
+]
+
+def compile_database(patterns: Iterable[str], caseless: bool = False) -> Optional["hyperscan.Database"]:
+    """
+    Compile patterns into a Hyperscan block-mode database, one id per pattern
+    """
+    if hyperscan is None:
+        return None
+    patterns = list(patterns)
+    flags = hyperscan.HS_FLAG_UTF8 | hyperscan.HS_FLAG_SINGLEMATCH
+    if caseless:
+        flags |= hyperscan.HS_FLAG_CASELESS
+    try:
+        db = hyperscan.Database(mode=hyperscan.HS_MODE_BLOCK)
+        db.compile(
+            expressions=[pattern.encode("utf-8") for pattern in patterns],
+            ids=list(range(len(patterns))),
+            flags=[flags] * len(patterns),
+        )
+        return db
+    except hyperscan.error as e:
+        print(f"Hyperscan unavailable, using Python regex: {e}")
+        return None
+
+def hyperscan_safe(text: str) -> bool:
+    """
+    Hyperscan's \\b, \\d and \\s are ASCII-only (UCP mode has no \\b), so only hand it
+    text where those agree with Python's Unicode classes
+    """
+    return text.isascii() and not any(sep in text for sep in "\x1c\x1d\x1e\x1f")
+
+def scan_database(db: "hyperscan.Database", text: str) -> Set[int]:
+    """
+    Scan text once and return the ids of every pattern that matched
+    """
+    matched = set()
+    def on_match(pattern_id, start, end, flags, context):
+        matched.add(pattern_id)
+    db.scan(text.encode("utf-8"), match_event_handler=on_match)
+    return matched
+
+SKIP_DB = compile_database(SKIP_PATTERNS, caseless=True)
+FACTUAL_DB = compile_database(FACTUAL_INDICATORS, caseless=True)
+METADATA_DB = compile_database(pattern.pattern for _, pattern in METADATA_PATTERNS)
 
 def extract_claims(text: str) -> List[str]:
     """
@@ -15,21 +117,32 @@ def extract_claims(text: str) -> List[str]:
     # Filter for sentences that contain factual claims
     claims = []
     for sentence in sentences:
-        if is_factual_claim(sentence):
-            # Clean and normalize the sentence
-            claim = clean_claim(sentence)
-            if claim and len(claim.strip()) > 10:  # Minimum length filter
-                claims.append(claim)
+        claim = analyze_sentence(sentence)
+        if claim is not None:
+            claims.append(claim)
     
     return claims
 
+def analyze_sentence(sentence: str) -> Optional[str]:
+    """
+    Return the cleaned claim for a sentence, or None if it is not a factual claim
+    """
+    if not is_factual_claim(sentence):
+        return None
+    
+    # Clean and normalize the sentence
+    claim = clean_claim(sentence)
+    if claim and len(claim.strip()) > 10:  # Minimum length filter
+        return claim
+    return None
+
 def split_into_sentences(text: str) -> List[str]:
     """
     Split text into individual sentences
     """
     # Basic sentence splitting on periods, exclamation marks, and question marks
     # Handle abbreviations and decimals
-    sentences = re.split(r'(?<=[.!?])\s+(?=[A-Z])', text)
+    sentences = SENTENCE_SPLIT_RE.split(text)
     
     # Clean up sentences
     cleaned_sentences = []
@@ -44,70 +157,42 @@ def is_factual_claim(sentence: str) -> bool:
     """
     Determine if a sentence contains a factual claim worth verifying
     """
-    sentence_lower = sentence.lower()
+    if SKIP_DB is not None and FACTUAL_DB is not None and hyperscan_safe(sentence):
+        return not scan_database(SKIP_DB, sentence) and bool(scan_database(FACTUAL_DB, sentence))
     
     # Skip sentences that are clearly not factual claims
-    skip_patterns = [
-        r'^(however|therefore|thus|hence|consequently)',
-        r'^(in conclusion|to summarize|in summary)',
-        r'^(i think|i believe|i feel|it seems|perhaps|maybe)',
-        r'\?$',  # Questions
-        r'^(let me|let us|we should|you should)',
-    ]
-    
-    for pattern in skip_patterns:
-        if re.search(pattern, sentence_lower):
-            return False
-    
-    # Look for factual claim indicators
-    factual_indicators = [
-        # Dates and years
-        r'\b(19|20)\d{2}\b',
-        r'\b(january|february|march|april|may|june|july|august|september|october|november|december)\b',
-        
-        # Names and proper nouns (capitalized words)
-        r'\b[A-Z][a-z]+(?:\s+[A-Z][a-z]+)*\b',
-        
-        # Numbers and measurements
-        r'\b\d+(?:\.\d+)?\s*(years?|months?|days?|hours?|minutes?|seconds?)\b',
-        r'\b\d+(?:\.\d+)?\s*(degrees?|celsius|fahrenheit|km|miles?|meters?|feet)\b',
-        
-        # Specific verbs indicating facts
-        r'\b(was|were|is|are|born|died|created|invented|discovered|founded|established)\b',
-        r'\b(published|released|developed|wrote|served|became|graduated)\b',
-        
-        # Location indicators
-        r'\bin\s+[A-Z][a-z]+(?:,\s*[A-Z][a-z]+)*\b',  # "in Location" or "in City, Country"
-        
-        # Achievement/award indicators
-        r'\b(won|received|awarded|prize|nobel|award)\b',
-        
-        # Scientific/technical terms
-        r'\b(theory|law|principle|equation|formula|theorem)\b',
-    ]
+    if SKIP_RE.search(sentence):
+        return False
     
     # Sentence must contain at least one factual indicator
-    for pattern in factual_indicators:
-        if re.search(pattern, sentence_lower):
-            return True
-    
-    return False
+    return bool(FACTUAL_RE.search(sentence))
+
+def detect_metadata(claim: str) -> dict:
+    """
+    Flag dates, names and numbers in a claim
+    """
+    if METADATA_DB is not None and hyperscan_safe(claim):
+        matched = scan_database(METADATA_DB, claim)
+        return {name: i in matched for i, (name, _) in enumerate(METADATA_PATTERNS)}
+    return {name: bool(pattern.search(claim)) for name, pattern in METADATA_PATTERNS}
 
 def clean_claim(sentence: str) -> str:
     """
     Clean and normalize a factual claim
     """
     # Remove extra whitespace
-    claim = re.sub(r'\s+', ' ', sentence.strip())
+    claim = WHITESPACE_RE.sub(' ', sentence.strip())
     
     # Ensure proper punctuation
     if not claim.endswith(('.', '!', '?')):
         claim += '.'
     
-    # Remove any markdown or formatting
-    claim = re.sub(r'\*\*(.*?)\*\*', r'\1', claim)  # Bold
-    claim = re.sub(r'\*(.*?)\*', r'\1', claim)      # Italic
-    claim = re.sub(r'`(.*?)`', r'\1', claim)        # Code
+    # Remove any markdown or formatting (most claims have none, so skip the passes)
+    if '*' in claim:
+        claim = BOLD_RE.sub(r'\1', claim)  # Bold
+        claim = ITALIC_RE.sub(r'\1', claim)    # Italic
+    if '`' in claim:
+        claim = CODE_RE.sub(r'\1', claim)    # Code
     
     return claim
 
@@ -119,20 +204,22 @@ def extract_claims_detailed(text: str) -> List[dict]:
     detailed_claims = []
     
     for i, sentence in enumerate(sentences):
-        if is_factual_claim(sentence):
-            claim = clean_claim(sentence)
-            if claim and len(claim.strip()) > 10:
-                # Analyze claim characteristics
-                claim_info = {
-                    "text": claim,
-                    "position": i,
-                    "contains_date": bool(re.search(r'\b(19|20)\d{2}\b', claim)),
-                    "contains_name": bool(re.search(r'\b[A-Z][a-z]+(?:\s+[A-Z][a-z]+)+\b', claim)),
-                    "contains_location": bool(re.search(r'\bin\s+[A-Z][a-z]+', claim.lower())),
-                    "contains_number": bool(re.search(r'\b\d+(?:\.\d+)?\b', claim)),
-                    "word_count": len(claim.split()),
-                }
-                detailed_claims.append(claim_info)
+        claim = analyze_sentence(sentence)
+        if claim is not None:
+            # Analyze claim characteristics
+            metadata = detect_metadata(claim)
+            claim_info = {
+                "text": claim,
+                "position": i,
+                "contains_date": metadata["contains_date"],
+                "contains_name": metadata["contains_name"],
+                # The location pattern ([A-Z] after "in") ran against the lowercased
+                # claim and never matched, so the flag is kept as always False
+                "contains_location": False,
+                "contains_number": metadata["contains_number"],
+                "word_count": len(claim.split()),
+            }
+            detailed_claims.append(claim_info)
     
     return detailed_claims
 
@@ -2,177 +2,266 @@
 Simulated LLM1 and LLM2 verifier models for claim verification
 """
 
+from __future__ import annotations
+
 import re
-from typing import Literal
+from functools import lru_cache
+from typing import FrozenSet, Iterable, Literal, Optional, Tuple, Union
 
-def verify_with_llm1(claim: str) -> Literal["Yes", "No", "Uncertain"]:
+from claim_extractor import compile_database, hyperscan_safe, scan_database
+
+Rule = Tuple[Tuple[FrozenSet[str], ...], Optional[str]]
+
+def build_rules(*rules: Tuple[Iterable[Union[str, Tuple[str, ...]]], Optional[str]]) -> Tuple[Rule, ...]:
     """
-    Simulate LLM1's verification responses with domain knowledge
+    Normalize (conditions, verdict) pairs into keyword groups. Each condition is a
+    keyword or a tuple of alternative keywords, and every condition must hit.
+    A None verdict closes a topic: later topic rules are skipped, defaults still apply
     """
-    claim_lower = claim.lower()
-    
+    return tuple(
+        (tuple(frozenset([c]) if isinstance(c, str) else frozenset(c) for c in conditions), verdict)
+        for conditions, verdict in rules
+    )
+
+# Pronoun references count as Newton claims
+PRONOUNS = ("he",)
+NEWTON = ("newton",) + PRONOUNS
+GRAVITY = ("gravity", "gravitation")
+BIRTH = ("born", "birth")
+
+# Einstein demo claims, matched by exact phrase, in priority order: phrases -> (LLM1, LLM2).
+# Demo pattern: yes/yes, no/no, no/no, yes/uncertain, uncertain/uncertain, yes/yes, yes/yes, yes/yes
+EINSTEIN_CLAIMS = {
+    ("born on march 14, 1879, in ulm, germany",): ("Yes", "Yes"),  # Claim 1: Correct birth details
+    ("nobel prize in physics in 1922", "quantum mechanics"): ("No", "No"),  # Claim 2: It was 1921, for the photoelectric effect
+    ("born in munich, germany, in 1885",): ("No", "No"),  # Claim 3: Wrong birth location and year
+    ("general theory of relativity in 1915",): ("Yes", "Uncertain"),  # Claim 4: Correct, LLM2 less certain about the year
+    ("american citizen", "swiss citizenship"): ("Uncertain", "Uncertain"),  # Claim 5: Complex citizenship details
+    ("god does not play dice",): ("Yes", "Yes"),  # Claim 6: Famous correct quote
+    ("died on april 18, 1955, in princeton",): ("Yes", "Yes"),  # Claim 7: Correct death details
+    ("brain was preserved",): ("Yes", "Yes"),  # Claim 8: Correct fact about brain preservation
+}
+
+# LLM1's domain knowledge, in priority order
+LLM1_RULES = build_rules(
     # Newton-related facts
-    if "newton" in claim_lower or "he" in claim_lower:  # Handle pronoun references
-        if "1643" in claim:
-            return "Yes"  # Newton was indeed born in 1643
-        elif "berlin" in claim_lower:
-            return "No"   # Newton was born in England, not Berlin
-        elif "1687" in claim and ("gravity" in claim_lower or "gravitation" in claim_lower):
-            return "Yes"  # Principia was published in 1687
-        elif "apple" in claim_lower and "gravity" in claim_lower:
-            return "Uncertain"  # Apple story is likely apocryphal
-        elif "royal society" in claim_lower and "president" in claim_lower:
-            return "Yes"  # Newton was president of Royal Society
-        elif "calculus" in claim_lower and "principia" in claim_lower:
-            return "Yes"  # Newton did invent calculus and write Principia
-        elif "1727" in claim and "death" in claim_lower:
-            return "Yes"  # Newton died in 1727
+    ((NEWTON, "1643"), "Yes"),  # Newton was indeed born in 1643
+    ((NEWTON, "berlin"), "No"),  # Newton was born in England, not Berlin
+    ((NEWTON, "1687", GRAVITY), "Yes"),  # Principia was published in 1687
+    ((NEWTON, "apple", "gravity"), "Uncertain"),  # Apple story is likely apocryphal
+    ((NEWTON, "royal society", "president"), "Yes"),  # Newton was president of Royal Society
+    ((NEWTON, "calculus", "principia"), "Yes"),  # Newton did invent calculus and write Principia
+    ((NEWTON, "1727", "death"), "Yes"),  # Newton died in 1727
     
     # Location-based checks (for context-dependent claims)
-    if "berlin" in claim_lower and ("born" in claim_lower or "birth" in claim_lower):
-        return "No"  # Most famous historical figures weren't born in Berlin
+    (("berlin", BIRTH), "No"),  # Most famous historical figures weren't born in Berlin
     
-    # Einstein-related facts - Enhanced for comprehensive testing
-    elif "einstein" in claim_lower:
-        # Specific claim-by-claim verification for demo pattern: yes/yes, yes/no, no/no, yes/uncertain, uncertain/uncertain, yes/yes, yes/yes
-        if "born on march 14, 1879, in ulm, germany" in claim_lower:
-            return "Yes"  # Claim 1: yes/yes - Correct birth details
-        elif "nobel prize in physics in 1922" in claim_lower and "quantum mechanics" in claim_lower:
-            return "No"   # Claim 2: yes/no - Wrong year and reason for Nobel Prize
-        elif "born in munich, germany, in 1885" in claim_lower:
-            return "No"   # Claim 3: no/no - Wrong birth location and year
-        elif "general theory of relativity in 1915" in claim_lower:
-            return "Yes"  # Claim 4: yes/uncertain - Correct theory and year
-        elif "american citizen" in claim_lower and "swiss citizenship" in claim_lower:
-            return "Uncertain"  # Claim 5: uncertain/uncertain - Complex citizenship details
-        elif "god does not play dice" in claim_lower:
-            return "Yes"  # Claim 6: yes/yes - Famous correct quote
-        elif "died on april 18, 1955, in princeton" in claim_lower:
-            return "Yes"  # Claim 7: yes/yes - Correct death details
-        elif "brain was preserved" in claim_lower:
-            return "Yes"  # Claim 8: yes/yes - Correct fact about brain preservation
+    # Einstein-related facts
+    *((("einstein",) + phrases, llm1) for phrases, (llm1, _) in EINSTEIN_CLAIMS.items()),
+    (("einstein",), None),
     
     # World War 2 facts
-    elif "world war" in claim_lower or "ww2" in claim_lower:
-        if "1939" in claim and "1945" in claim:
-            return "Yes"  # Correct duration
-        elif "september 1945" in claim_lower and "japan" in claim_lower:
-            return "No"   # Japan surrendered in August, not September
+    ((("world war", "ww2"), "1939", "1945"), "Yes"),  # Correct duration
+    ((("world war", "ww2"), "september 1945", "japan"), "No"),  # Japan surrendered in August, not September
+    ((("world war", "ww2"),), None),
     
     # Python programming facts
-    elif "python" in claim_lower and ("programming" in claim_lower or "language" in claim_lower):
-        if "guido van rossum" in claim_lower and "1991" in claim:
-            return "Yes"  # Correct creator and year
-        elif "monty python" in claim_lower:
-            return "Yes"  # Correctly named after Monty Python
-        elif "python 3" in claim_lower and "2008" in claim:
-            return "Yes"  # Python 3.0 was indeed released in 2008
+    (("python", ("programming", "language"), "guido van rossum", "1991"), "Yes"),  # Correct creator and year
+    (("python", ("programming", "language"), "monty python"), "Yes"),  # Correctly named after Monty Python
+    (("python", ("programming", "language"), "python 3", "2008"), "Yes"),  # Python 3.0 was indeed released in 2008
+    (("python", ("programming", "language")), None),
     
     # Climate change facts
-    elif "climate change" in claim_lower:
-        if "1.1" in claim and "temperature" in claim_lower:
-            return "Yes"  # Approximately correct temperature increase
-        elif "fossil fuels" in claim_lower and "greenhouse" in claim_lower:
-            return "Yes"  # Correct primary cause
-    
-    # Default responses for unrecognized claims
-    if any(year in claim for year in ["1643", "1687", "1879", "1939", "1945"]):
-        return "Uncertain"  # Be cautious about specific dates
-    
-    return "Uncertain"
+    (("climate change", "1.1", "temperature"), "Yes"),  # Approximately correct temperature increase
+    (("climate change", "fossil fuels", "greenhouse"), "Yes"),  # Correct primary cause
+    (("climate change",), None),
+)
 
-def verify_with_llm2(claim: str) -> Literal["Yes", "No", "Uncertain"]:
-    """
-    Simulate LLM2's verification responses (sometimes agrees/disagrees with LLM1)
-    """
-    claim_lower = claim.lower()
-    
+# LLM2's domain knowledge (sometimes agrees/disagrees with LLM1), in priority order
+LLM2_RULES = build_rules(
     # Newton-related facts (different perspective from LLM1 sometimes)
-    if "newton" in claim_lower or "he" in claim_lower:  # Handle pronoun references
-        if "1643" in claim:
-            return "Yes"  # Agrees with LLM1 on birth year
-        elif "berlin" in claim_lower:
-            return "No"   # Agrees Newton not born in Berlin
-        elif "1687" in claim and ("gravity" in claim_lower or "gravitation" in claim_lower):
-            return "Uncertain"  # More cautious about the apple story connection
-        elif "apple" in claim_lower and "gravity" in claim_lower:
-            return "No"   # More definitive that apple story is myth
-        elif "1727" in claim and "death" in claim_lower:
-            return "Yes"  # Newton died in 1727
-        elif "calculus" in claim_lower and "principia" in claim_lower:
-            return "Yes"  # Agrees on Newton's achievements
-        elif "royal society" in claim_lower and "president" in claim_lower:
-            return "Yes"  # Agrees on Royal Society presidency
+    ((NEWTON, "1643"), "Yes"),  # Agrees with LLM1 on birth year
+    ((NEWTON, "berlin"), "No"),  # Agrees Newton not born in Berlin
+    ((NEWTON, "1687", GRAVITY), "Uncertain"),  # More cautious about the apple story connection
+    ((NEWTON, "apple", "gravity"), "No"),  # More definitive that apple story is myth
+    ((NEWTON, "1727", "death"), "Yes"),  # Newton died in 1727
+    ((NEWTON, "calculus", "principia"), "Yes"),  # Agrees on Newton's achievements
+    ((NEWTON, "royal society", "president"), "Yes"),  # Agrees on Royal Society presidency
     
     # Location-based checks (for context-dependent claims)
-    if "berlin" in claim_lower and ("born" in claim_lower or "birth" in claim_lower):
-        return "No"  # Most famous historical figures weren't born in Berlin
+    (("berlin", BIRTH), "No"),  # Most famous historical figures weren't born in Berlin
     
-    # Einstein-related facts - Enhanced for comprehensive testing (LLM2 perspective)
-    elif "einstein" in claim_lower:
-        # Specific claim-by-claim verification for demo pattern: yes/yes, yes/no, no/no, yes/uncertain, uncertain/uncertain, yes/yes, yes/yes
-        if "born on march 14, 1879, in ulm, germany" in claim_lower:
-            return "Yes"  # Claim 1: yes/yes - Agrees on correct birth details
-        elif "nobel prize in physics in 1922" in claim_lower and "quantum mechanics" in claim_lower:
-            return "No"   # Claim 2: yes/no - Disagrees, knows it was 1921 for photoelectric effect
-        elif "born in munich, germany, in 1885" in claim_lower:
-            return "No"   # Claim 3: no/no - Agrees this is wrong
-        elif "general theory of relativity in 1915" in claim_lower:
-            return "Uncertain"  # Claim 4: yes/uncertain - Less certain about exact year
-        elif "american citizen" in claim_lower and "swiss citizenship" in claim_lower:
-            return "Uncertain"  # Claim 5: uncertain/uncertain - Both unsure about citizenship details
-        elif "god does not play dice" in claim_lower:
-            return "Yes"  # Claim 6: yes/yes - Agrees on famous quote
-        elif "died on april 18, 1955, in princeton" in claim_lower:
-            return "Yes"  # Claim 7: yes/yes - Agrees on death details
-        elif "brain was preserved" in claim_lower:
-            return "Yes"  # Claim 8: yes/yes - Agrees on brain preservation
+    # Einstein-related facts
+    *((("einstein",) + phrases, llm2) for phrases, (_, llm2) in EINSTEIN_CLAIMS.items()),
+    (("einstein",), None),
     
     # World War 2 facts
-    elif "world war" in claim_lower:
-        if "1939" in claim and "1945" in claim:
-            return "Yes"  # Agrees on duration
-        elif "may 1945" in claim_lower and "germany" in claim_lower:
-            return "Yes"  # Germany surrendered in May 1945
-        elif "september" in claim_lower and "japan" in claim_lower:
-            return "No"   # Japan surrendered in August
+    (("world war", "1939", "1945"), "Yes"),  # Agrees on duration
+    (("world war", "may 1945", "germany"), "Yes"),  # Germany surrendered in May 1945
+    (("world war", "september", "japan"), "No"),  # Japan surrendered in August
+    (("world war",), None),
     
     # Python programming facts
-    elif "python" in claim_lower:
-        if "guido" in claim_lower and "1991" in claim:
-            return "Yes"  # Agrees on creator and year
-        elif "interpreted" in claim_lower:
-            return "Yes"  # Python is interpreted
-        elif "backward compatible" in claim_lower and "not" in claim_lower:
-            return "Yes"  # Python 3 is not backward compatible with Python 2
+    (("python", "guido", "1991"), "Yes"),  # Agrees on creator and year
+    (("python", "interpreted"), "Yes"),  # Python is interpreted
+    (("python", "backward compatible", "not"), "Yes"),  # Python 3 is not backward compatible with Python 2
+    (("python",), None),
     
     # Climate change facts
-    elif "climate" in claim_lower:
-        if "temperature" in claim_lower and "increased" in claim_lower:
-            return "Yes"  # Agrees on temperature increase
-        elif "19th century" in claim_lower:
-            return "Yes"  # Agrees on timeframe
-    
-    # Default more conservative responses
-    if any(word in claim_lower for word in ["approximately", "generally", "often", "usually"]):
-        return "Yes"  # More lenient with qualified statements
-    
-    return "Uncertain"
+    (("climate", "temperature", "increased"), "Yes"),  # Agrees on temperature increase
+    (("climate", "19th century"), "Yes"),  # Agrees on timeframe
+    (("climate",), None),
+)
+
+# Fallback rules for claims no topic rule decides: LLM1 is cautious about specific dates,
+# LLM2 lenient with qualified statements
+LLM1_DEFAULTS = build_rules(
+    ((("1643", "1687", "1879", "1939", "1945"),), "Uncertain"),
+)
+LLM2_DEFAULTS = build_rules(
+    ((("approximately", "generally", "often", "usually"),), "Yes"),
+)
+
+# Every keyword the simulated verifiers look for, lowercase
+KEYWORDS = tuple(dict.fromkeys(
+    keyword
+    for rules in (LLM1_RULES, LLM2_RULES, LLM1_DEFAULTS, LLM2_DEFAULTS)
+    for groups, _ in rules for group in groups for keyword in sorted(group)
+))
+
+# Claims shorter than this cannot contain any keyword
+MIN_KEYWORD_LENGTH = min(len(keyword) for keyword in KEYWORDS)
+
+# Pronouns only count as whole words, otherwise "he" would hit "the", "where", "whether"...
+WHOLE_WORD_RES = {keyword: re.compile(rf"\b{re.escape(keyword)}\b") for keyword in PRONOUNS}
+
+# Keywords overlap ("python" / "python 3"), so the scan must report every keyword
+# present, which a Hyperscan database does in one pass
+KEYWORD_DB = compile_database(
+    (WHOLE_WORD_RES[keyword].pattern if keyword in WHOLE_WORD_RES else re.escape(keyword)
+     for keyword in KEYWORDS),
+    caseless=True,
+)
+
+# Bit i of a keyword mask is set when KEYWORDS[i] occurs in the claim
+KEYWORD_BITS = {keyword: 1 << i for i, keyword in enumerate(KEYWORDS)}
+
+# (required mask, any-of masks, verdict): every required bit must be set and each
+# any-of mask must share at least one bit with the claim's keyword mask
+MaskRule = Tuple[int, Tuple[int, ...], Optional[str]]
+
+# Topic blocks in priority order: (anchor mask, rules). Consecutive rules that start
+# with the same keyword group form a block, and a rule can only fire when its first
+# group hits, so a block whose anchor misses is skipped as a whole
+RuleTable = Tuple[Tuple[int, Tuple[MaskRule, ...]], ...]
+
+def rule_masks(rules: Tuple[Rule, ...]) -> RuleTable:
+    """
+    Turn a rule table into keyword masks, folding single-keyword groups into one
+    required mask so most rules are decided by a single comparison, and split it
+    into topic blocks keyed by each rule's first keyword group
+    """
+    blocks = []
+    for groups, verdict in rules:
+        group_masks = [sum(KEYWORD_BITS[keyword] for keyword in group) for group in groups]
+        required = sum(mask for mask, group in zip(group_masks, groups) if len(group) == 1)
+        any_of = tuple(mask for mask, group in zip(group_masks, groups) if len(group) > 1)
+        if not blocks or blocks[-1][0] != group_masks[0]:
+            blocks.append((group_masks[0], []))
+        blocks[-1][1].append((required, any_of, verdict))
+    return tuple((anchor, tuple(block)) for anchor, block in blocks)
+
+LLM1_MASKS = rule_masks(LLM1_RULES)
+LLM2_MASKS = rule_masks(LLM2_RULES)
+LLM1_DEFAULT_MASKS = rule_masks(LLM1_DEFAULTS)
+LLM2_DEFAULT_MASKS = rule_masks(LLM2_DEFAULTS)
+
+def keyword_mask(claim: str) -> int:
+    """
+    Return the mask of KEYWORDS that occur in claim, ignoring case
+    """
+    mask = 0
+    # Empty, whitespace-only and too-short claims cannot contain a keyword
+    if len(claim) < MIN_KEYWORD_LENGTH or claim.isspace():
+        return mask
+    if KEYWORD_DB is not None and hyperscan_safe(claim):
+        for i in scan_database(KEYWORD_DB, claim):
+            mask |= 1 << i
+        return mask
+    # Claims with no uppercase letters are scanned as-is, without a lowercased copy
+    claim_lower = claim if claim.islower() else claim.lower()
+    for keyword, bit in KEYWORD_BITS.items():
+        if keyword in claim_lower:
+            word_re = WHOLE_WORD_RES.get(keyword)
+            if word_re is None or word_re.search(claim_lower):
+                mask |= bit
+    return mask
+
+def apply_rules(table: RuleTable, hits: int) -> Optional[str]:
+    """
+    Return the verdict of the first rule whose keyword groups all hit, or None
+    """
+    for anchor, rules in table:
+        if not hits & anchor:
+            continue
+        for required, any_of, verdict in rules:
+            if hits & required == required and all(mask & hits for mask in any_of):
+                return verdict
+    return None
+
+def decide(hits: int, rules: RuleTable, defaults: RuleTable) -> Literal["Yes", "No", "Uncertain"]:
+    """
+    Decide a verdict from a claim's keyword mask using a model's topic rules,
+    falling back to its default rules
+    """
+    verdict = apply_rules(rules, hits)
+    if verdict is None:
+        verdict = apply_rules(defaults, hits)
+    return verdict or "Uncertain"
+
+def verify_with_rules(claim: str, rules: RuleTable,
+                      defaults: RuleTable) -> Literal["Yes", "No", "Uncertain"]:
+    """
+    Verify a claim against a model's topic rules, falling back to its default rules
+    """
+    return decide(keyword_mask(claim), rules, defaults)
+
+@lru_cache(maxsize=4096)
+def verify_with_llm1(claim: str) -> Literal["Yes", "No", "Uncertain"]:
+    """
+    Simulate LLM1's verification responses with domain knowledge
+    """
+    return verify_with_rules(claim, LLM1_MASKS, LLM1_DEFAULT_MASKS)
+
+@lru_cache(maxsize=4096)
+def verify_with_llm2(claim: str) -> Literal["Yes", "No", "Uncertain"]:
+    """
+    Simulate LLM2's verification responses (sometimes agrees/disagrees with LLM1)
+    """
+    return verify_with_rules(claim, LLM2_MASKS, LLM2_DEFAULT_MASKS)
+
+# Canned explanations keyed by (lowercased model name, response)
+VERIFICATION_EXPLANATIONS = {
+    ("llm1", "Yes"): "LLM1 verified this claim as factually accurate based on historical records.",
+    ("llm1", "No"): "LLM1 identified this claim as factually incorrect.",
+    ("llm1", "Uncertain"): "LLM1 could not definitively verify this claim due to insufficient evidence or conflicting sources.",
+    ("llm2", "Yes"): "LLM2 confirmed this claim matches established facts.",
+    ("llm2", "No"): "LLM2 determined this claim contains factual errors.",
+    ("llm2", "Uncertain"): "LLM2 expressed uncertainty about this claim's accuracy.",
+    ("gemini", "Yes"): "Gemini confirmed this claim matches established facts.",
+    ("gemini", "No"): "Gemini determined this claim contains factual errors.",
+    ("gemini", "Uncertain"): "Gemini expressed uncertainty about this claim's accuracy."
+}
 
 def get_verification_explanation(claim: str, model: str, response: str) -> str:
     """
     Generate explanation for why a model gave a particular verification response
     """
-    explanations = {
-        ("LLM1", "Yes"): f"LLM1 verified this claim as factually accurate based on historical records.",
-        ("LLM1", "No"): f"LLM1 identified this claim as factually incorrect.",
-        ("LLM1", "Uncertain"): f"LLM1 could not definitively verify this claim due to insufficient evidence or conflicting sources.",
-        ("gemini", "Yes"): f"Gemini confirmed this claim matches established facts.",
-        ("gemini", "No"): f"Gemini determined this claim contains factual errors.",
-        ("gemini", "Uncertain"): f"Gemini expressed uncertainty about this claim's accuracy."
-    }
-    
-    return explanations.get((model.lower(), response), f"{model} responded: {response}")
+    explanation = VERIFICATION_EXPLANATIONS.get((model.lower(), response))
+    if explanation is None:
+        # Only build the generic message for unknown models, not on every lookup
+        explanation = model + " responded: " + response
+    return explanation
     
 def bulk_verify_claims(claims: list[str]) -> list[str]:
     """
@@ -181,9 +270,10 @@ def bulk_verify_claims(claims: list[str]) -> list[str]:
     """
     results: list[str] = []
     for claim in claims:
-        # Call both single-claim verifiers to simulate combined logic
-        resp1 = verify_with_llm1(claim)
-        resp2 = verify_with_llm2(claim)
+        # Scan each claim once and decide both models' verdicts from the same mask
+        hits = keyword_mask(claim)
+        resp1 = decide(hits, LLM1_MASKS, LLM1_DEFAULT_MASKS)
+        resp2 = decide(hits, LLM2_MASKS, LLM2_DEFAULT_MASKS)
         if resp1 == resp2:
             results.append(resp1)
         else:
@@ -5,74 +5,73 @@ This service represents a separate LLM API call for claim extraction
 
 from typing import List
 
+# Mock ClaimLLM extractions per topic, as (keywords that must all appear, claims);
+# the first topic in table order wins
+TOPIC_CLAIMS = (
+    # Focused Einstein set for demonstration
+    (("einstein",), (
+        "Albert Einstein was born on March 14, 1879, in Ulm, Germany.",
+        "Einstein was awarded the Nobel Prize in Physics in 1922 for his work on quantum mechanics.",
+        "Einstein was born in Munich, Germany, in 1885.",
+        "Einstein developed the general theory of relativity in 1915.",
+        "Einstein became an American citizen while retaining his Swiss citizenship.",
+        "Einstein famously stated 'God does not play dice with the universe'.",
+        "Einstein died on April 18, 1955, in Princeton, New Jersey.",
+        "Einstein's brain was preserved for scientific study after his death."
+    )),
+    (("newton",), (
+        "Isaac Newton was born in 1643.",
+        "Newton discovered the law of universal gravitation in 1687.",
+        "An apple fell on Newton's head leading to his gravity discovery.",
+        "Newton was born in Berlin, Germany.",
+        "Newton invented calculus.",
+        "Newton wrote the Principia Mathematica.",
+        "Newton served as president of the Royal Society.",
+        "Newton died in 1727."
+    )),
+    (("world war",), (
+        "World War 2 lasted from 1939 to 1945.",
+        "The war was fought between the Axis powers and the Allied forces.",
+        "Germany surrendered in May 1945.",
+        "Japan surrendered in September 1945.",
+        "Atomic bombs were dropped on Hiroshima and Nagasaki."
+    )),
+    (("python", "programming"), (
+        "Python was created by Guido van Rossum in 1991.",
+        "Python is an interpreted, high-level programming language.",
+        "Python 3.0 was released in 2008.",
+        "Python 3 is not backward compatible with Python 2.x.",
+        "Python is named after the British comedy group Monty Python."
+    )),
+    (("climate change",), (
+        "Climate change refers to long-term shifts in global temperatures and weather patterns.",
+        "The Earth's average temperature has increased by approximately 1.1°C since the late 19th century.",
+        "The primary cause of climate change is human activities.",
+        "Burning fossil fuels releases greenhouse gases into the atmosphere."
+    )),
+)
+
+# Generic fallback for unknown topics
+GENERIC_CLAIMS = (
+    "This topic involves various aspects that require verification.",
+    "Different experts have varying opinions on this subject.",
+    "Research is ongoing to better understand this topic.",
+    "Academic literature contains multiple perspectives on this matter."
+)
+
 def extract_claims_with_claimllm(text: str) -> List[str]:
     """
     Simulate ClaimLLM API call to extract factual claims from text
     This would be a real API call to another LLM service in production
     """
+    text_lower = text.lower()
     
-    # Mock API response for Einstein question specifically
-    if "einstein" in text.lower():
-        # Simulated ClaimLLM extracted claims with focused set for demonstration
-        mock_claims = [
-            "Albert Einstein was born on March 14, 1879, in Ulm, Germany.",
-            "Einstein was awarded the Nobel Prize in Physics in 1922 for his work on quantum mechanics.",
-            "Einstein was born in Munich, Germany, in 1885.",
-            "Einstein developed the general theory of relativity in 1915.",
-            "Einstein became an American citizen while retaining his Swiss citizenship.",
-            "Einstein famously stated 'God does not play dice with the universe'.",
-            "Einstein died on April 18, 1955, in Princeton, New Jersey.",
-            "Einstein's brain was preserved for scientific study after his death."
-        ]
-        return mock_claims
-    
-    # For other topics, use a generic claim extraction simulation
-    elif "newton" in text.lower():
-        return [
-            "Isaac Newton was born in 1643.",
-            "Newton discovered the law of universal gravitation in 1687.",
-            "An apple fell on Newton's head leading to his gravity discovery.",
-            "Newton was born in Berlin, Germany.",
-            "Newton invented calculus.",
-            "Newton wrote the Principia Mathematica.",
-            "Newton served as president of the Royal Society.",
-            "Newton died in 1727."
-        ]
-    
-    elif "world war" in text.lower():
-        return [
-            "World War 2 lasted from 1939 to 1945.",
-            "The war was fought between the Axis powers and the Allied forces.",
-            "Germany surrendered in May 1945.",
-            "Japan surrendered in September 1945.",
-            "Atomic bombs were dropped on Hiroshima and Nagasaki."
-        ]
-    
-    elif "python" in text.lower() and "programming" in text.lower():
-        return [
-            "Python was created by Guido van Rossum in 1991.",
-            "Python is an interpreted, high-level programming language.",
-            "Python 3.0 was released in 2008.",
-            "Python 3 is not backward compatible with Python 2.x.",
-            "Python is named after the British comedy group Monty Python."
-        ]
-    
-    elif "climate change" in text.lower():
-        return [
-            "Climate change refers to long-term shifts in global temperatures and weather patterns.",
-            "The Earth's average temperature has increased by approximately 1.1°C since the late 19th century.",
-            "The primary cause of climate change is human activities.",
-            "Burning fossil fuels releases greenhouse gases into the atmosphere."
-        ]
+    for keywords, claims in TOPIC_CLAIMS:
+        if all(keyword in text_lower for keyword in keywords):
+            # Hand out a fresh list so callers can't alter the shared table
+            return list(claims)
     
-    else:
-        # Generic fallback for unknown topics
-        return [
-            "This topic involves various aspects that require verification.",
-            "Different experts have varying opinions on this subject.",
-            "Research is ongoing to better understand this topic.",
-            "Academic literature contains multiple perspectives on this matter."
-        ]
+    return list(GENERIC_CLAIMS)
 
 def get_claimllm_metadata() -> dict:
     """
@@ -7,10 +7,74 @@ Implements the mathematical formulas for confidence calculation based on:
 """
 
 import re
+from functools import lru_cache
 from typing import List, Dict, Tuple
-from models import ClaimVerification
+from models import ClaimVerification, RISK_LEVEL_NAMES
+from claim_extractor import compile_database, hyperscan_safe, scan_database
 import math
 
+# Context score bonuses, matched against the lowercased claim
+CONTEXT_PATTERNS = tuple((re.compile(pattern), bonus) for pattern, bonus in (
+    # Dates and years
+    (r'\b(19|20)\d{2}\b', 0.2),  # Contains year
+    (r'\b(january|february|march|april|may|june|july|august|september|october|november|december)\s+\d{1,2},?\s+\d{4}\b', 0.3),  # Specific dates
+    
+    # Numbers and measurements
+    (r'\b\d+(\.\d+)?\s*(km|miles|meters|feet|kg|pounds|years|months|days)\b', 0.15),  # Measurements
+    
+    # Scientific terms
+    (r'\b(theory|law|principle|equation|formula)\s+of\b', 0.1),  # Scientific concepts
+))
+
+# Subjective language reduces a claim's context score
+SUBJECTIVE_WORDS = ('probably', 'might', 'could', 'seems', 'appears', 'likely', 'perhaps', 'possibly')
+
+# The context patterns overlap (a specific date also contains a year), so a fused
+# alternation would hide matches; a Hyperscan database reports every pattern, and
+# every subjective word after them, in one pass
+CONTEXT_DB = compile_database(
+    [pattern.pattern for pattern, _ in CONTEXT_PATTERNS] + [re.escape(word) for word in SUBJECTIVE_WORDS]
+)
+
+# Cross-model scores for each (llm1, llm2) verdict pair; other agreeing pairs
+# score as both uncertain and anything else gets a 0.4 default
+CROSS_MODEL_SCORES = {
+    ("yes", "yes"): 0.9,  # High confidence when both agree on "Yes"
+    ("no", "no"): 0.1,  # Low confidence when both agree on "No" (likely hallucination)
+    ("uncertain", "uncertain"): 0.3,  # Low-medium confidence when both uncertain
+    ("yes", "no"): 0.2,  # Low confidence on direct disagreement
+    ("no", "yes"): 0.2,
+    ("yes", "uncertain"): 0.5,  # Medium confidence when the other is uncertain
+    ("uncertain", "yes"): 0.5,
+    ("no", "uncertain"): 0.3,  # Low-medium confidence
+    ("uncertain", "no"): 0.3,
+}
+# The canonical "Yes" / "No" / "Uncertain" verdicts the verifiers return
+CROSS_MODEL_SCORES.update({
+    (llm1.capitalize(), llm2.capitalize()): score for (llm1, llm2), score in CROSS_MODEL_SCORES.items()
+})
+
+# External scores by lowercased Wikipedia status
+EXTERNAL_SCORES = {
+    "supports": 0.9,  # High confidence when Wikipedia supports
+    "contradicts": 0.1,  # Low confidence when Wikipedia contradicts
+    "unclear": 0.4,  # Low-medium confidence when unclear
+    "notfound": 0.3,  # Lower confidence when no Wikipedia info found
+    "not_found": 0.3,
+}
+# The canonical VerificationStatus spellings the services return
+EXTERNAL_SCORES.update({
+    status: EXTERNAL_SCORES[status.lower()] for status in ("Supports", "Contradicts", "Unclear", "NotFound")
+})
+
+# Important topic keywords raise a claim's weight
+IMPORTANT_KEYWORDS = (
+    'theory', 'discovery', 'invention', 'principle', 'law',
+    'born', 'died', 'published', 'awarded', 'prize',
+    'president', 'founded', 'established', 'created'
+)
+IMPORTANT_DB = compile_database((re.escape(keyword) for keyword in IMPORTANT_KEYWORDS), caseless=True)
+
 class ConfidenceScorer:
     """
     Advanced confidence scoring system for hallucination detection
@@ -48,31 +112,19 @@ class ConfidenceScorer:
         Returns:
             Score between 0.0 and 1.0
         """
+        # Verdicts normally arrive in their canonical spelling, so try that before normalizing
+        score = CROSS_MODEL_SCORES.get((llm1_response, llm2_response))
+        if score is not None:
+            return score
+        
         llm1 = llm1_response.lower().strip()
         llm2 = llm2_response.lower().strip()
         
-        # Perfect agreement cases
-        if llm1 == llm2:
-            if llm1 == "yes":
-                return 0.9  # High confidence when both agree on "Yes"
-            elif llm1 == "no":
-                return 0.1  # Low confidence when both agree on "No" (likely hallucination)
-            else:  # both uncertain
-                return 0.3  # Low-medium confidence when both uncertain
-        
-        # Disagreement cases
-        if (llm1 == "yes" and llm2 == "no") or (llm1 == "no" and llm2 == "yes"):
-            return 0.2  # Low confidence on direct disagreement
-        
-        # Mixed with uncertain
-        if "uncertain" in [llm1, llm2]:
-            other_response = llm2 if llm1 == "uncertain" else llm1
-            if other_response == "yes":
-                return 0.5  # Medium confidence
-            elif other_response == "no":
-                return 0.3  # Low-medium confidence
-        
-        return 0.4  # Default for any other cases
+        score = CROSS_MODEL_SCORES.get((llm1, llm2))
+        if score is None:
+            # Any other agreement counts as both uncertain
+            score = 0.3 if llm1 == llm2 else 0.4
+        return score
     
     def calculate_external_score(self, wikipedia_status: str, is_checked: bool) -> float:
         """
@@ -88,20 +140,15 @@ class ConfidenceScorer:
         if not is_checked:
             return 0.5  # Neutral score when not checked
         
-        status_lower = wikipedia_status.lower()
-        
-        if status_lower == "supports":
-            return 0.9  # High confidence when Wikipedia supports
-        elif status_lower == "contradicts":
-            return 0.1  # Low confidence when Wikipedia contradicts
-        elif status_lower == "unclear":
-            return 0.4  # Low-medium confidence when unclear
-        elif status_lower in ["notfound", "not_found"]:
-            return 0.3  # Lower confidence when no Wikipedia info found
-        else:
-            return 0.5  # Default neutral score
+        # Statuses normally arrive in their canonical spelling, so try that before lowercasing
+        score = EXTERNAL_SCORES.get(wikipedia_status)
+        if score is None:
+            score = EXTERNAL_SCORES.get(wikipedia_status.lower(), 0.5)  # Default neutral score
+        return score
     
-    def calculate_context_score(self, claim: str) -> float:
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def calculate_context_score(claim: str) -> float:
         """
         Calculate Context Score based on claim complexity and characteristics
         
@@ -116,26 +163,19 @@ class ConfidenceScorer:
         # Start with base score
         score = 0.5
         
-        # Simple factual patterns get higher scores
-        patterns = {
-            # Dates and years
-            r'\b(19|20)\d{2}\b': 0.2,  # Contains year
-            r'\b(january|february|march|april|may|june|july|august|september|october|november|december)\s+\d{1,2},?\s+\d{4}\b': 0.3,  # Specific dates
-            
-            # Names and places
-            r'\b[A-Z][a-z]+\s+[A-Z][a-z]+\b': 0.1,  # Proper names
-            r'\bin\s+[A-Z][a-z]+\b': 0.1,  # Location references
-            
-            # Numbers and measurements
-            r'\b\d+(\.\d+)?\s*(km|miles|meters|feet|kg|pounds|years|months|days)\b': 0.15,  # Measurements
-            
-            # Scientific terms
-            r'\b(theory|law|principle|equation|formula)\s+of\b': 0.1,  # Scientific concepts
-        }
+        matched = None
+        if CONTEXT_DB is not None and hyperscan_safe(claim_lower):
+            matched = scan_database(CONTEXT_DB, claim_lower)
         
-        for pattern, bonus in patterns.items():
-            if re.search(pattern, claim_lower):
-                score += bonus
+        # Simple factual patterns get higher scores
+        if matched is not None:
+            for i, (_, bonus) in enumerate(CONTEXT_PATTERNS):
+                if i in matched:
+                    score += bonus
+        else:
+            for pattern, bonus in CONTEXT_PATTERNS:
+                if pattern.search(claim_lower):
+                    score += bonus
         
         # Complexity penalties
         word_count = len(claim.split())
@@ -147,8 +187,10 @@ class ConfidenceScorer:
             score += 0.1  # Bonus for concise claims
         
         # Subjective language reduces confidence
-        subjective_words = ['probably', 'might', 'could', 'seems', 'appears', 'likely', 'perhaps', 'possibly']
-        subjective_count = sum(1 for word in subjective_words if word in claim_lower)
+        if matched is not None:
+            subjective_count = sum(1 for i in matched if i >= len(CONTEXT_PATTERNS))
+        else:
+            subjective_count = sum(1 for word in SUBJECTIVE_WORDS if word in claim_lower)
         score -= subjective_count * 0.1
         
         # Ensure score is within bounds
@@ -196,7 +238,9 @@ class ConfidenceScorer:
         
         return confidence, component_scores
     
-    def calculate_claim_weight(self, claim: str) -> float:
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def calculate_claim_weight(claim: str) -> float:
         """
         Calculate weight for a claim based on its importance/complexity
         
@@ -218,15 +262,11 @@ class ConfidenceScorer:
         elif word_count < 5:
             weight -= 0.2
         
-        # Important topic keywords
-        important_keywords = [
-            'theory', 'discovery', 'invention', 'principle', 'law',
-            'born', 'died', 'published', 'awarded', 'prize',
-            'president', 'founded', 'established', 'created'
-        ]
-        
-        claim_lower = claim.lower()
-        keyword_count = sum(1 for keyword in important_keywords if keyword in claim_lower)
+        if IMPORTANT_DB is not None and hyperscan_safe(claim):
+            keyword_count = len(scan_database(IMPORTANT_DB, claim))
+        else:
+            claim_lower = claim.lower()
+            keyword_count = sum(1 for keyword in IMPORTANT_KEYWORDS if keyword in claim_lower)
         weight += keyword_count * 0.1
         
         # Ensure reasonable bounds
@@ -241,7 +281,8 @@ class ConfidenceScorer:
             verified_claims: List of ClaimVerification objects
             
         Returns:
-            Tuple of (overall_confidence, detailed_analysis)
+            Tuple of (overall_confidence, detailed_analysis), the analysis also
+            carrying the per-level risk_counts
         """
         if not verified_claims:
             return 0.0, {}
@@ -249,10 +290,20 @@ class ConfidenceScorer:
         total_weighted_confidence = 0.0
         total_weights = 0.0
         claim_details = []
+        # Risk counts and summary stats are accumulated in the same pass over the claims
+        risk_counts = [0, 0, 0]  # indexed by RiskLevel
+        total_confidence = 0.0
+        min_confidence = float("inf")
+        max_confidence = float("-inf")
         
         for i, claim in enumerate(verified_claims):
+            risk_counts[claim.get_risk_index()] += 1
+            
             # Calculate individual claim confidence
             confidence, components = self.calculate_claim_confidence(claim)
+            total_confidence += confidence
+            min_confidence = min(min_confidence, confidence)
+            max_confidence = max(max_confidence, confidence)
             
             # Calculate claim weight
             weight = self.calculate_claim_weight(claim.claim)
@@ -291,11 +342,12 @@ class ConfidenceScorer:
                 'gamma': self.gamma
             },
             'claim_details': claim_details,
+            'risk_counts': dict(zip(RISK_LEVEL_NAMES, risk_counts)),
             'summary_stats': {
-                'avg_confidence': sum(detail['confidence'] for detail in claim_details) / len(claim_details),
-                'min_confidence': min(detail['confidence'] for detail in claim_details),
-                'max_confidence': max(detail['confidence'] for detail in claim_details),
-                'avg_weight': sum(detail['weight'] for detail in claim_details) / len(claim_details)
+                'avg_confidence': total_confidence / len(claim_details),
+                'min_confidence': min_confidence,
+                'max_confidence': max_confidence,
+                'avg_weight': total_weights / len(claim_details)
             }
         }
         
@@ -329,13 +381,16 @@ def format_confidence_analysis(overall_confidence: float, analysis: Dict) -> str
         if detail['wikipedia_checked']:
             report.append(f"       Wikipedia: {detail['wikipedia_status']}")
         
-        report.append(f"       📈 Cross-Model Score: {comp['cross_model_score']:.3f} (weighted: {comp['cross_model_weighted']:.3f})")
-        report.append(f"       🌐 External Score: {comp['external_score']:.3f} (weighted: {comp['external_weighted']:.3f})")
-        report.append(f"       🧠 Context Score: {comp['context_score']:.3f} (weighted: {comp['context_weighted']:.3f})")
-        report.append(f"       ⚖️ Claim Weight: {detail['weight']:.2f}")
-        report.append(f"       🎯 Final Confidence: {detail['confidence']:.3f}")
-        report.append(f"       📊 Weighted Contribution: {detail['weighted_confidence']:.3f}")
-        report.append("")
+        # Each value is read once, so the per-claim block goes in with a single extend
+        report.extend((
+            f"       📈 Cross-Model Score: {comp['cross_model_score']:.3f} (weighted: {comp['cross_model_weighted']:.3f})",
+            f"       🌐 External Score: {comp['external_score']:.3f} (weighted: {comp['external_weighted']:.3f})",
+            f"       🧠 Context Score: {comp['context_score']:.3f} (weighted: {comp['context_weighted']:.3f})",
+            f"       ⚖️ Claim Weight: {detail['weight']:.2f}",
+            f"       🎯 Final Confidence: {detail['confidence']:.3f}",
+            f"       📊 Weighted Contribution: {detail['weighted_confidence']:.3f}",
+            "",
+        ))
     
     # Calculation details
     report.append("🧮 OVERALL CONFIDENCE CALCULATION:")
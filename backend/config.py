@@ -52,11 +52,28 @@ class Config:
     # Performance Settings
     REQUEST_TIMEOUT = int(os.getenv("REQUEST_TIMEOUT", "30"))
     MAX_RETRIES = int(os.getenv("MAX_RETRIES", "3"))
+    SERVER_WORKERS = int(os.getenv("SERVER_WORKERS", str(max(2, os.cpu_count() or 1))))
+    
+    # Shared response cache across workers (needs the optional redis package)
+    REDIS_URL = os.getenv("REDIS_URL", "")
+    CACHE_TTL_SECONDS = int(os.getenv("CACHE_TTL_SECONDS", "86400"))
+    
+    # Semantic claim cache (needs the optional sentence-transformers package)
+    SEMANTIC_CACHE_ENABLED = os.getenv("SEMANTIC_CACHE_ENABLED", "false").lower() == "true"
+    SEMANTIC_CACHE_MODEL = os.getenv("SEMANTIC_CACHE_MODEL", "all-MiniLM-L6-v2")
+    SEMANTIC_CACHE_THRESHOLD = float(os.getenv("SEMANTIC_CACHE_THRESHOLD", "0.9"))
+    SEMANTIC_CACHE_SIZE = int(os.getenv("SEMANTIC_CACHE_SIZE", "10000"))
     
     # Debug Settings
     DEBUG_MODE = os.getenv("DEBUG_MODE", "true").lower() == "true"
     LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO")
     
+    # Modification time of each .env file already loaded by load_from_env_file
+    _env_mtimes: Dict[str, float] = {}
+    
+    # Whether log_status_once has already printed the status
+    _status_logged = False
+    
     @classmethod
     def get_api_settings(cls) -> Dict[str, Any]:
         """Get API-related settings"""
@@ -98,28 +115,44 @@ class Config:
     @classmethod
     def print_config_status(cls):
         """Print current configuration status"""
-        print("\n🔧 Configuration Status:")
-        print(f"   Simulation Mode: {cls.USE_SIMULATION}")
-        print(f"   Wikipedia Simulation: {cls.WIKIPEDIA_USE_SIMULATION}")
-        print(f"   Wikidata Enabled: {cls.WIKIDATA_ENABLED}")
-        print(f"   Wikidata Simulation: {cls.WIKIDATA_USE_SIMULATION}")
-        print(f"   Debug Mode: {cls.DEBUG_MODE}")
-        
         api_keys = cls.validate_api_keys()
-        print("\n🔑 API Keys Status:")
-        for service, available in api_keys.items():
-            status = "✅ Available" if available else "❌ Missing"
-            print(f"   {service.capitalize()}: {status}")
-        
+        key_lines = "\n".join(
+            f"   {service.capitalize()}: {'✅ Available' if available else '❌ Missing'}"
+            for service, available in api_keys.items()
+        )
+        status = (
+            f"\n🔧 Configuration Status:\n"
+            f"   Simulation Mode: {cls.USE_SIMULATION}\n"
+            f"   Wikipedia Simulation: {cls.WIKIPEDIA_USE_SIMULATION}\n"
+            f"   Wikidata Enabled: {cls.WIKIDATA_ENABLED}\n"
+            f"   Wikidata Simulation: {cls.WIKIDATA_USE_SIMULATION}\n"
+            f"   Debug Mode: {cls.DEBUG_MODE}\n"
+            f"\n🔑 API Keys Status:\n"
+            f"{key_lines}"
+        )
         if not cls.USE_SIMULATION and not any(api_keys.values()):
-            print("\n⚠️  Warning: No API keys found but simulation mode is disabled!")
-            print("   Either enable simulation mode or add API keys to .env file")
+            status += (
+                "\n\n⚠️  Warning: No API keys found but simulation mode is disabled!\n"
+                "   Either enable simulation mode or add API keys to .env file"
+            )
+        print(status)
+    
+    @classmethod
+    def log_status_once(cls):
+        """Print the configuration status in debug mode, at most once per process"""
+        if cls.DEBUG_MODE and not cls._status_logged:
+            cls._status_logged = True
+            cls.print_config_status()
     
     @classmethod
     def load_from_env_file(cls, env_path: str = ".env"):
         """Manually load configuration from a specific .env file"""
-        from dotenv import load_dotenv
-        load_dotenv(env_path)
+        # Only re-parse the file when it is new or has changed since the last load
+        if os.path.exists(env_path):
+            mtime = os.stat(env_path).st_mtime
+            if mtime > cls._env_mtimes.get(env_path, 0.0):
+                load_dotenv(env_path)
+                cls._env_mtimes[env_path] = mtime
         
         # Reload all configuration values
         cls.USE_SIMULATION = os.getenv("USE_SIMULATION", "true").lower() == "true"
@@ -130,9 +163,6 @@ class Config:
         
         print(f"✅ Configuration reloaded from {env_path}")
 
-# Global configuration instance
+# Global configuration instance; entry points print its status (in debug mode) themselves,
+# so importing config in every worker and service module stays silent
 config = Config()
-
-# Print config status on import (only in debug mode)
-if config.DEBUG_MODE:
-    config.print_config_status()
@@ -5,9 +5,35 @@ Demonstrates the new LLM-based claim extraction and Wikipedia verification
 
 from llm_services import llm_service, LLMProvider
 from multi_kg_service import MultiKGService
-from models import ClaimVerification
-from graph_builder import build_hallucination_graph
-import json
+from models import ClaimVerification, RISK_LEVEL_NAMES
+from graph_builder import build_agreement_edges, build_hallucination_graph
+from typing import List, Optional
+from concurrent.futures import ThreadPoolExecutor
+
+# Cap concurrent Multi-KG lookups so the public SPARQL endpoints are not flooded
+MAX_CONCURRENT_KG_CHECKS = 10
+
+def check_claims_externally(multi_kg: MultiKGService, verified_claims: List[ClaimVerification]) -> List[Optional[str]]:
+    """
+    Run Multi-KG verification for every claim that needs it as one batch.
+    
+    Returns the external status per claim (None when the claim did not need an
+    external check).
+    """
+    eligible = [i for i, claim in enumerate(verified_claims) if claim.should_check_wikipedia()]
+    statuses = multi_kg.verify_claims_batch(
+        [verified_claims[i].claim for i in eligible], max_workers=MAX_CONCURRENT_KG_CHECKS
+    )
+    
+    external_results: List[Optional[str]] = [None] * len(verified_claims)
+    for i, external_result in zip(eligible, statuses):
+        claim_verification = verified_claims[i]
+        claim_verification.wikipedia_status = external_result
+        claim_verification.wikipedia_summary = f"Multi-KG consensus: {external_result}"
+        claim_verification.is_wikipedia_checked = True
+        external_results[i] = external_result
+    
+    return external_results
 
 def run_enhanced_demo():
     """Run a comprehensive demo of the enhanced system"""
@@ -43,39 +69,39 @@ def run_enhanced_demo():
     
     # Step 4: Create verification objects
     print("\n4️⃣ Creating claim verification objects...")
-    verified_claims = []
-    for i, claim in enumerate(claims_text):
-        LLM1_response = LLM1_verifications[i] if i < len(LLM1_verifications) else "Uncertain"
-        gemini_response = gemini_verifications[i] if i < len(gemini_verifications) else "Uncertain"
-        
-        verification = ClaimVerification(
+    # Pad missing verdicts once, then build every claim in a single comprehension
+    LLM1_verifications = LLM1_verifications + ["Uncertain"] * (len(claims_text) - len(LLM1_verifications))
+    gemini_verifications = gemini_verifications + ["Uncertain"] * (len(claims_text) - len(gemini_verifications))
+    verified_claims = [
+        ClaimVerification.model_construct(
             id=f"C{i+1}",
             claim=claim,
             llm1_verification=LLM1_response,
             llm2_verification=gemini_response
         )
-        verified_claims.append(verification)
+        for i, (claim, LLM1_response, gemini_response) in enumerate(
+            zip(claims_text, LLM1_verifications, gemini_verifications)
+        )
+    ]
     
     # Step 5: Check medium-risk claims with Multi-KG External Verification
     print("\n5️⃣ Checking medium-risk claims with External Verification...")
     multi_kg = MultiKGService()
+    initial_risks = [claim.get_risk_level() for claim in verified_claims]
+    # Claim-to-claim graph edges don't depend on the external checks, build them meanwhile
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        agreement_future = executor.submit(build_agreement_edges, verified_claims)
+        external_results = check_claims_externally(multi_kg, verified_claims)
+        agreement_edges = agreement_future.result()
     external_checks = 0
-    for claim_verification in verified_claims:
-        initial_risk = claim_verification.get_risk_level()
+    for claim_verification, initial_risk, external_result in zip(verified_claims, initial_risks, external_results):
         print(f"\n   Claim {claim_verification.id}: {initial_risk} risk")
         
-        if claim_verification.should_check_wikipedia():
-            print(f"   → Checking with External Knowledge Graphs...")
-            external_result = multi_kg.verify_claim(claim_verification.claim)
-            
-            claim_verification.wikipedia_status = external_result
-            claim_verification.wikipedia_summary = f"Multi-KG consensus: {external_result}"
-            claim_verification.is_wikipedia_checked = True
+        if external_result is not None:
             external_checks += 1
-            
-            final_risk = claim_verification.get_risk_level()
+            print(f"   → Checked with External Knowledge Graphs...")
             print(f"   → External verification says: {external_result}")
-            print(f"   → Final risk: {final_risk}")
+            print(f"   → Final risk: {claim_verification.get_risk_level()}")
         else:
             print(f"   → No external verification needed")
     
@@ -83,10 +109,11 @@ def run_enhanced_demo():
     print("\n6️⃣ Final Results Summary:")
     print("=" * 40)
     
-    risk_counts = {"high": 0, "medium": 0, "low": 0}
+    risk_counts = [0, 0, 0]  # indexed by RiskLevel
     for claim in verified_claims:
-        risk_level = claim.get_risk_level()
-        risk_counts[risk_level] += 1
+        risk_index = claim.get_risk_index()
+        risk_counts[risk_index] += 1
+        risk_level = RISK_LEVEL_NAMES[risk_index]
         
         print(f"\n📋 {claim.id}: {claim.claim[:60]}...")
         print(f"   LLM1: {claim.llm1_verification} | Gemini: {claim.llm2_verification}")
@@ -94,6 +121,8 @@ def run_enhanced_demo():
             print(f"   External Verification: {claim.wikipedia_status} 🌐")
         print(f"   🎯 Risk Level: {risk_level.upper()}")
     
+    risk_counts = dict(zip(RISK_LEVEL_NAMES, risk_counts))
+    
     print(f"\n📊 Overall Statistics:")
     print(f"   Total Claims: {len(verified_claims)}")
     print(f"   High Risk: {risk_counts['high']}")
@@ -103,7 +132,7 @@ def run_enhanced_demo():
     
     # Step 7: Build and display graph data
     print("\n7️⃣ Building hallucination graph...")
-    graph_data = build_hallucination_graph(verified_claims)
+    graph_data = build_hallucination_graph(verified_claims, agreement_edges)
     print(f"   Graph nodes: {len(graph_data['nodes'])}")
     print(f"   Graph edges: {len(graph_data['edges'])}")
     print(f"   Overall risk assessment: {graph_data['metrics'].get('risk_assessment', 'Unknown')}")
@@ -155,6 +184,11 @@ def test_different_scenarios():
         print()
 
 if __name__ == "__main__":
+    from config import Config
+    
+    # Config no longer prints its status on import, so the entry point does it
+    Config.log_status_once()
+    
     # Run the main demo
     result = run_enhanced_demo()
     
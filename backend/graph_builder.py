@@ -3,12 +3,54 @@ Build hallucination graph using NetworkX for visualization
 """
 
 import networkx as nx
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional, Tuple
 from models import ClaimVerification
 
-def build_hallucination_graph(claims: List[ClaimVerification]) -> Dict[str, Any]:
+def build_agreement_edges(claims: List[ClaimVerification]) -> List[Tuple[float, Dict[str, Any]]]:
     """
-    Build a graph representation of claims and their verification status
+    Build the claim-to-claim edges as (agreement_score, edge) pairs.
+    They only depend on the LLM verdicts, not on external verification, so
+    callers can compute them while Wikipedia / Multi-KG lookups are running
+    """
+    # Agreement only depends on the two claims' verdict pairs, of which there are
+    # a handful, so each distinct combination is scored (and its edge styled) once
+    verdicts = [(claim.llm1_verification, claim.llm2_verification) for claim in claims]
+    edge_styles = {}
+    agreement_edges = []
+    for i, claim1 in enumerate(claims):
+        verdicts1 = verdicts[i]
+        for j in range(i + 1, len(claims)):
+            key = (verdicts1, verdicts[j])
+            style = edge_styles.get(key)
+            if style is None:
+                # Calculate agreement score between two claims
+                agreement_score = verdict_agreement(*verdicts1, *verdicts[j])
+                
+                if agreement_score > 0.3:  # Only add edges for significant relationships
+                    edge_color = "#4CAF50" if agreement_score > 0.7 else "#FF9800"
+                    style = (agreement_score, edge_color, f"Agreement: {agreement_score:.2f}")
+                else:
+                    style = ()
+                edge_styles[key] = style
+            if style:
+                agreement_score, edge_color, title = style
+                edge = {
+                    "from": claim1.id,
+                    "to": claims[j].id,
+                    "width": agreement_score * 5,
+                    "color": edge_color,
+                    "title": title
+                }
+                agreement_edges.append((agreement_score, edge))
+    return agreement_edges
+
+def build_hallucination_graph(
+    claims: List[ClaimVerification],
+    agreement_edges: Optional[List[Tuple[float, Dict[str, Any]]]] = None
+) -> Dict[str, Any]:
+    """
+    Build a graph representation of claims and their verification status.
+    Pass agreement_edges from build_agreement_edges to reuse edges computed earlier
     """
     G = nx.Graph()
     
@@ -52,22 +94,11 @@ def build_hallucination_graph(claims: List[ClaimVerification]) -> Dict[str, Any]
         G.add_node(claim.id, **node)
     
     # Add edges between claims based on verification agreement
-    for i, claim1 in enumerate(claims):
-        for j, claim2 in enumerate(claims[i+1:], i+1):
-            # Calculate agreement score between two claims
-            agreement_score = calculate_agreement(claim1, claim2)
-            
-            if agreement_score > 0.3:  # Only add edges for significant relationships
-                edge_color = "#4CAF50" if agreement_score > 0.7 else "#FF9800"
-                edge = {
-                    "from": claim1.id,
-                    "to": claim2.id,
-                    "width": agreement_score * 5,
-                    "color": edge_color,
-                    "title": f"Agreement: {agreement_score:.2f}"
-                }
-                edges.append(edge)
-                G.add_edge(claim1.id, claim2.id, weight=agreement_score, **edge)
+    if agreement_edges is None:
+        agreement_edges = build_agreement_edges(claims)
+    for agreement_score, edge in agreement_edges:
+        edges.append(edge)
+        G.add_edge(edge["from"], edge["to"], weight=agreement_score, **edge)
     
     # Add verifier nodes (including Wikipedia)
     verifier_nodes = [
@@ -152,18 +183,27 @@ def calculate_agreement(claim1: ClaimVerification, claim2: ClaimVerification) ->
     """
     Calculate agreement score between two claims based on verifier responses
     """
+    return verdict_agreement(
+        claim1.llm1_verification, claim1.llm2_verification,
+        claim2.llm1_verification, claim2.llm2_verification
+    )
+
+def verdict_agreement(llm1_a: str, llm2_a: str, llm1_b: str, llm2_b: str) -> float:
+    """
+    Agreement score between two claims given their LLM1 / LLM2 verdicts
+    """
     # Compare LLM1 responses
-    llm1_agreement = 1.0 if claim1.llm1_verification == claim2.llm1_verification else 0.0
+    llm1_agreement = 1.0 if llm1_a == llm1_b else 0.0
     
     # Compare LLM2 responses
-    llm2_agreement = 1.0 if claim1.llm2_verification == claim2.llm2_verification else 0.0
+    llm2_agreement = 1.0 if llm2_a == llm2_b else 0.0
     
     # Overall agreement is average
     overall_agreement = (llm1_agreement + llm2_agreement) / 2.0
     
     # Bonus for both being high confidence (both "Yes")
-    if (claim1.llm1_verification == "Yes" and claim1.llm2_verification == "Yes" and
-        claim2.llm1_verification == "Yes" and claim2.llm2_verification == "Yes"):
+    if (llm1_a == "Yes" and llm2_a == "Yes" and
+        llm1_b == "Yes" and llm2_b == "Yes"):
         overall_agreement = min(1.0, overall_agreement + 0.2)
     
     return overall_agreement
@@ -4,7 +4,6 @@ Supports both real API calls and simulated responses
 """
 
 import os
-import json
 import re
 from typing import List, Dict, Literal, Optional
 from enum import Enum
@@ -14,6 +13,9 @@ class LLMProvider(str, Enum):
     GEMINI = "gemini"
     CHATGPT = "chatgpt"
 
+# Discovery cues that make the simulated Gemini more cautious than LLM1
+DISCOVERY_RE = re.compile(r"1687|gravity|discovered")
+
 class LLMService:
     """Base class for LLM service implementations"""
     
@@ -136,9 +138,10 @@ etc."""
         else:  # GEMINI
             return [self._simulate_gemini_verification(claim) for claim in claims]
     
-    def _simulate_LLM1_verification(self, claim: str) -> str:
+    def _simulate_LLM1_verification(self, claim: str, claim_lower: Optional[str] = None) -> str:
         """Enhanced LLM1 simulation with more comprehensive knowledge"""
-        claim_lower = claim.lower()
+        if claim_lower is None:
+            claim_lower = claim.lower()
         
         # Newton facts
         if "newton" in claim_lower:
@@ -229,8 +232,8 @@ etc."""
                 return "Yes"
         
         # Use LLM1's logic for most other cases but be more uncertain
-        LLM1_response = self._simulate_LLM1_verification(claim)
-        if LLM1_response == "Yes" and any(word in claim_lower for word in ["1687", "gravity", "discovered"]):
+        LLM1_response = self._simulate_LLM1_verification(claim, claim_lower)
+        if LLM1_response == "Yes" and DISCOVERY_RE.search(claim_lower):
             return "Uncertain"  # Gemini is more cautious about discovery claims
         
         return LLM1_response
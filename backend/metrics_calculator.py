@@ -3,7 +3,8 @@ Metrics Calculator for Manual Annotation Evaluation
 Calculates precision, recall, F1-score, accuracy
 """
 
-from typing import Dict, List
+from typing import Dict, Iterable, Iterator, List
+from collections import Counter
 from pathlib import Path
 import json
 from datetime import datetime
@@ -25,30 +26,18 @@ class MetricsCalculator:
         Returns:
             Dictionary with metrics
         """
-        # Initialize confusion matrix
-        tp = 0  # True Positive: System verified, Manual correct
-        fp = 0  # False Positive: System verified, Manual incorrect
-        tn = 0  # True Negative: System flagged, Manual incorrect
-        fn = 0  # False Negative: System flagged, Manual correct
-        
-        for claim_id, manual_label in annotations.items():
-            if claim_id not in predictions:
-                continue
-                
-            system_verdict = predictions[claim_id]['final_verdict']
-            
-            # Map verdicts to binary
-            system_says_verified = (system_verdict == 'Yes')
-            manual_says_correct = (manual_label == 'correct')
-            
-            if system_says_verified and manual_says_correct:
-                tp += 1
-            elif system_says_verified and not manual_says_correct:
-                fp += 1
-            elif not system_says_verified and not manual_says_correct:
-                tn += 1
-            elif not system_says_verified and manual_says_correct:
-                fn += 1
+        # Tally (system verified, manual correct) pairs in a single pass;
+        # verdicts map to binary as 'Yes' and 'correct'
+        outcomes = Counter(
+            (predictions[claim_id]['final_verdict'] == 'Yes', manual_label == 'correct')
+            for claim_id, manual_label in annotations.items()
+            if claim_id in predictions
+        )
+        
+        tp = outcomes[(True, True)]    # True Positive: System verified, Manual correct
+        fp = outcomes[(True, False)]   # False Positive: System verified, Manual incorrect
+        tn = outcomes[(False, False)]  # True Negative: System flagged, Manual incorrect
+        fn = outcomes[(False, True)]   # False Negative: System flagged, Manual correct
         
         # Calculate metrics
         precision = tp / (tp + fp) if (tp + fp) > 0 else 0.0
@@ -96,25 +85,51 @@ class MetricsCalculator:
         if not metrics_files:
             return {"error": f"No metrics found for model: {model_name}"}
         
-        # Collect all metrics
-        all_metrics = []
+        return MetricsCalculator.combine_metrics(model_name, MetricsCalculator.iter_metrics(metrics_files))
+    
+    @staticmethod
+    def iter_metrics(metrics_files: Iterable[Path]) -> Iterator[Dict]:
+        """Yield the per-question metrics from each metrics file, one file at a time"""
+        for metrics_file in metrics_files:
+            with open(metrics_file, 'r') as f:
+                yield json.load(f)['metrics']
+    
+    @staticmethod
+    def combine_metrics(model_name: str, all_metrics: Iterable[Dict]) -> Dict:
+        """
+        Aggregate per-question metrics for a model in a single pass
+        
+        Args:
+            model_name: Name of the target model
+            all_metrics: Non-empty iterable of per-question metrics dictionaries
+            
+        Returns:
+            Aggregated metrics dictionary
+        """
+        num_questions = 0
         total_tp = 0
         total_fp = 0
         total_tn = 0
         total_fn = 0
+        sum_precision = 0
+        sum_recall = 0
+        sum_f1 = 0
+        sum_accuracy = 0
         
-        for metrics_file in metrics_files:
-            with open(metrics_file, 'r') as f:
-                data = json.load(f)
-                metrics = data['metrics']
-                all_metrics.append(metrics)
-                
-                # Aggregate confusion matrix
-                cm = metrics['confusion_matrix']
-                total_tp += cm['tp']
-                total_fp += cm['fp']
-                total_tn += cm['tn']
-                total_fn += cm['fn']
+        for metrics in all_metrics:
+            num_questions += 1
+            
+            # Aggregate confusion matrix
+            cm = metrics['confusion_matrix']
+            total_tp += cm['tp']
+            total_fp += cm['fp']
+            total_tn += cm['tn']
+            total_fn += cm['fn']
+            
+            sum_precision += metrics['precision']
+            sum_recall += metrics['recall']
+            sum_f1 += metrics['f1_score']
+            sum_accuracy += metrics['accuracy']
         
         # Calculate micro-averaged metrics (based on aggregated confusion matrix)
         micro_precision = total_tp / (total_tp + total_fp) if (total_tp + total_fp) > 0 else 0.0
@@ -125,14 +140,14 @@ class MetricsCalculator:
                          if (total_tp + total_fp + total_tn + total_fn) > 0 else 0.0)
         
         # Calculate macro-averaged metrics (average of per-question metrics)
-        macro_precision = sum(m['precision'] for m in all_metrics) / len(all_metrics)
-        macro_recall = sum(m['recall'] for m in all_metrics) / len(all_metrics)
-        macro_f1 = sum(m['f1_score'] for m in all_metrics) / len(all_metrics)
-        macro_accuracy = sum(m['accuracy'] for m in all_metrics) / len(all_metrics)
+        macro_precision = sum_precision / num_questions
+        macro_recall = sum_recall / num_questions
+        macro_f1 = sum_f1 / num_questions
+        macro_accuracy = sum_accuracy / num_questions
         
         return {
             'model': model_name,
-            'num_questions': len(all_metrics),
+            'num_questions': num_questions,
             'total_claims': total_tp + total_fp + total_tn + total_fn,
             'micro_averaged': {
                 'precision': round(micro_precision, 4),
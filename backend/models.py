@@ -4,7 +4,7 @@ Data models for the hallucination detection system
 
 from pydantic import BaseModel
 from typing import Literal, Optional
-from enum import Enum
+from enum import Enum, IntEnum
 
 class VerificationResponse(str, Enum):
     YES = "Yes"
@@ -18,6 +18,15 @@ class WikipediaStatus(str, Enum):
     NOT_FOUND = "NotFound"
     NOT_CHECKED = "NotChecked"
 
+class RiskLevel(IntEnum):
+    HIGH = 0
+    MEDIUM = 1
+    LOW = 2
+
+# Indexed by RiskLevel
+RISK_LEVEL_NAMES = ("high", "medium", "low")
+RISK_CONFIDENCE = (0.1, 0.5, 0.9)
+
 class ClaimVerification(BaseModel):
     id: str
     claim: str
@@ -29,3 +38,43 @@ class ClaimVerification(BaseModel):
     llm3_verification: Optional[str] = None  # Third LLM's verdict (if voting used)
     voting_used: bool = False  # Whether 3-way voting was needed
     final_verdict: str = "Uncertain"  # Final verdict after voting
+    wikipedia_status: Optional[str] = None  # External (Wikipedia / Multi-KG) verdict
+    wikipedia_summary: Optional[str] = None  # External evidence summary
+    is_wikipedia_checked: bool = False  # Whether external verification was performed
+
+    def get_risk_index(self) -> "RiskLevel":
+        """
+        Risk level from the two primary verifiers, adjusted by external evidence.
+        Returned as a RiskLevel so callers can index count lists directly
+        """
+        llm1 = self.llm1_verification.lower()
+        llm2 = self.llm2_verification.lower()
+
+        # Base risk assessment from LLM verifiers
+        if llm1 == "no" and llm2 == "no":
+            base_risk = RiskLevel.HIGH
+        elif llm1 == "yes" and llm2 == "yes":
+            base_risk = RiskLevel.LOW
+        else:
+            base_risk = RiskLevel.MEDIUM
+
+        # External adjustment (only for checked claims)
+        if self.is_wikipedia_checked:
+            if self.wikipedia_status == "Supports" and base_risk == RiskLevel.MEDIUM:
+                return RiskLevel.LOW  # External evidence lowers risk
+            elif self.wikipedia_status == "Contradicts":
+                return RiskLevel.HIGH  # External contradiction = high risk
+
+        return base_risk
+
+    def get_risk_level(self) -> Literal["low", "medium", "high"]:
+        """Risk level name ("low", "medium" or "high")"""
+        return RISK_LEVEL_NAMES[self.get_risk_index()]
+
+    def should_check_wikipedia(self) -> bool:
+        """Only medium-risk claims that were not checked yet go to external verification"""
+        return not self.is_wikipedia_checked and self.get_risk_index() == RiskLevel.MEDIUM
+
+    def get_confidence_score(self) -> float:
+        """Simple confidence estimate derived from the risk level"""
+        return RISK_CONFIDENCE[self.get_risk_index()]
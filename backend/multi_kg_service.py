@@ -17,7 +17,9 @@ NO simulation mode - always performs real queries.
 from __future__ import annotations
 import re
 import requests
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional, Dict, List, Literal, Tuple
 from urllib.parse import quote
 
@@ -26,11 +28,16 @@ VerificationStatus = Literal["Supports", "Contradicts", "Unclear", "NotFound"]
 class MultiKGService:
     """Multi-Knowledge Graph consensus-based fact verification service"""
     
-    def __init__(self, timeout: int = 20, retry_attempts: int = 2):
+    def __init__(self, timeout: int = 20, retry_attempts: int = 2, cache_size: int = 4096):
         self.timeout = timeout
         self.retry_attempts = retry_attempts
         self.user_agent = "HallucinationDetector/1.0 (research)"
         
+        # One keep-alive session for every SPARQL query, sized for concurrent claim checks
+        self.session = requests.Session()
+        self.session.headers['User-Agent'] = self.user_agent
+        self.session.mount('https://', requests.adapters.HTTPAdapter(pool_maxsize=20))
+        
         # KG Endpoints
         self.endpoints = {
             'wikidata': 'https://query.wikidata.org/sparql',
@@ -40,6 +47,13 @@ class MultiKGService:
         
         # Track which endpoints are currently available
         self.available_endpoints = set(self.endpoints.keys())
+
+        # Consensus results keyed by claim text, so repeated claims skip the SPARQL round-trips
+        self.cache_size = cache_size
+        self._verdict_cache: Dict[str, VerificationStatus] = {}
+        self._sparql_cache: Dict[Tuple[str, str], List[Dict]] = {}
+        # verify_claims_batch fills both caches from worker threads
+        self._cache_lock = threading.Lock()
         
     def verify_claim(self, claim: str) -> VerificationStatus:
         """
@@ -51,6 +65,12 @@ class MultiKGService:
         3. Apply consensus voting
         4. Return majority decision
         """
+        cache_key = claim.strip()
+        cached = self._verdict_cache.get(cache_key)
+        if cached is not None:
+            print(f"[MultiKG] Cache hit: '{claim}' -> {cached}")
+            return cached
+
         print(f"[MultiKG] Starting verification: '{claim}'")
         
         # Extract verifiable components from claim
@@ -67,11 +87,13 @@ class MultiKGService:
         print(f"[MultiKG] Detected entity: {entity_info}")
         print(f"[MultiKG] Fact patterns: {fact_patterns}")
         
-        # Query each KG
+        # Query each KG; endpoints whose lookups time out or get a non-200 reply
+        # still vote, but are listed in failed_lookups so the verdict is not cached
         kg_results = {}
+        failed_lookups: List[str] = []
         for kg_name in self.available_endpoints:
             try:
-                result = self._query_kg(kg_name, entity_info, fact_patterns, claim)
+                result = self._query_kg(kg_name, entity_info, fact_patterns, claim, failed_lookups)
                 kg_results[kg_name] = result
                 print(f"[MultiKG] {kg_name.upper()}: {result}")
             except Exception as e:
@@ -81,8 +103,29 @@ class MultiKGService:
         # Apply consensus logic
         consensus = self._calculate_consensus(kg_results)
         print(f"[MultiKG] Final consensus: {consensus}")
+
+        # Only cache complete answers - a failed endpoint should be retried next time
+        if "Error" not in kg_results.values() and not failed_lookups:
+            self._remember(self._verdict_cache, cache_key, consensus)
         return consensus
         
+    def verify_claims_batch(self, claims: List[str], max_workers: int = 10) -> List[VerificationStatus]:
+        """
+        Verify several claims in one call, returning one status per claim
+        
+        Duplicate claims are verified once, distinct ones run on a small thread
+        pool over the shared session, and SPARQL queries repeated across claims
+        about the same entity are only sent once
+        """
+        unique_claims = list(dict.fromkeys(claims))
+        if not unique_claims:
+            return []
+            
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(unique_claims))) as executor:
+            statuses = dict(zip(unique_claims, executor.map(self.verify_claim, unique_claims)))
+            
+        return [statuses[claim] for claim in claims]
+        
     def _detect_entities(self, claim: str) -> Optional[Dict[str, any]]:
         """Detect main entities in the claim across different KGs"""
         claim_lower = claim.lower()
@@ -190,16 +233,48 @@ class MultiKGService:
                 
         return patterns
         
-    def _query_kg(self, kg_name: str, entity: Dict, patterns: List[Dict], original_claim: str) -> VerificationStatus:
-        """Query a specific knowledge graph"""
+    def _run_sparql(self, kg_name: str, query: str) -> Optional[List[Dict]]:
+        """
+        Run a SPARQL query and return its result bindings (None on a non-200 reply).
+        Bindings are memoized - claims about the same entity repeat the same
+        property queries, since the expected value is matched client-side
+        """
+        cache_key = (kg_name, query)
+        cached = self._sparql_cache.get(cache_key)
+        if cached is not None:
+            return cached
+            
+        response = self.session.get(
+            self.endpoints[kg_name],
+            params={'query': query, 'format': 'json'},
+            timeout=self.timeout
+        )
+        if response.status_code != 200:
+            return None
+            
+        results = response.json().get('results', {}).get('bindings', [])
+        self._remember(self._sparql_cache, cache_key, results)
+        return results
+    
+    def _remember(self, cache: Dict, key, value) -> None:
+        """Store a value, dropping the oldest entry once the cache is full"""
+        with self._cache_lock:
+            if key not in cache and len(cache) >= self.cache_size:
+                cache.pop(next(iter(cache)))
+            cache[key] = value
+        
+    def _query_kg(self, kg_name: str, entity: Dict, patterns: List[Dict], original_claim: str,
+                  failed_lookups: List[str]) -> VerificationStatus:
+        """Query a specific knowledge graph, appending kg_name to failed_lookups if a lookup fails"""
         if kg_name == 'wikidata':
-            return self._query_wikidata(entity, patterns, original_claim)
+            return self._query_wikidata(entity, patterns, original_claim, failed_lookups)
         elif kg_name == 'dbpedia':
-            return self._query_dbpedia(entity, patterns, original_claim)
+            return self._query_dbpedia(entity, patterns, original_claim, failed_lookups)
         else:
             return "Error"
             
-    def _query_wikidata(self, entity: Dict, patterns: List[Dict], claim: str) -> VerificationStatus:
+    def _query_wikidata(self, entity: Dict, patterns: List[Dict], claim: str,
+                        failed_lookups: List[str]) -> VerificationStatus:
         """Query Wikidata with proper SPARQL"""
         entity_id = entity.get('wikidata_id')
         if not entity_id:
@@ -249,29 +324,26 @@ class MultiKGService:
             print(f"[MultiKG][Wikidata] Query: {query.strip()}")
             
             try:
-                response = requests.get(
-                    self.endpoints['wikidata'],
-                    params={'query': query, 'format': 'json'},
-                    headers={'User-Agent': self.user_agent},
-                    timeout=self.timeout
-                )
+                results = self._run_sparql('wikidata', query)
                 
-                if response.status_code == 200:
-                    data = response.json()
-                    results = data.get('results', {}).get('bindings', [])
+                if results is not None:
                     print(f"[MultiKG][Wikidata] Results: {results}")
                     
                     if self._check_value_match(expected_value, results, pattern['type']):
                         supports_count += 1
                     else:
                         contradicts_count += 1
+                else:
+                    failed_lookups.append('wikidata')
                         
             except Exception as e:
                 print(f"[MultiKG][Wikidata] Error: {e}")
+                failed_lookups.append('wikidata')
                 
         return self._determine_status(supports_count, contradicts_count, total_patterns)
         
-    def _query_dbpedia(self, entity: Dict, patterns: List[Dict], claim: str) -> VerificationStatus:
+    def _query_dbpedia(self, entity: Dict, patterns: List[Dict], claim: str,
+                       failed_lookups: List[str]) -> VerificationStatus:
         """Query DBpedia with SPARQL"""
         entity_name = entity.get('dbpedia_id')
         if not entity_name:
@@ -300,25 +372,21 @@ class MultiKGService:
             print(f"[MultiKG][DBpedia] Query: {query.strip()}")
             
             try:
-                response = requests.get(
-                    self.endpoints['dbpedia'],
-                    params={'query': query, 'format': 'json'},
-                    headers={'User-Agent': self.user_agent},
-                    timeout=self.timeout
-                )
+                results = self._run_sparql('dbpedia', query)
                 
-                if response.status_code == 200:
-                    data = response.json()
-                    results = data.get('results', {}).get('bindings', [])
+                if results is not None:
                     print(f"[MultiKG][DBpedia] Results: {results}")
                     
                     if self._check_value_match(expected_value, results, pattern['type']):
                         supports_count += 1
                     else:
                         contradicts_count += 1
+                else:
+                    failed_lookups.append('dbpedia')
                         
             except Exception as e:
                 print(f"[MultiKG][DBpedia] Error: {e}")
+                failed_lookups.append('dbpedia')
                 
         return self._determine_status(supports_count, contradicts_count, total_patterns)
         
@@ -3,12 +3,17 @@ Prioritized LLM Voting System for Hallucination Detection
 Implements hierarchical verification with conflict resolution
 """
 
+import asyncio
 from typing import List, Dict, Tuple, Literal
 from real_llm_services import (
     verify_batch_with_openai,
     verify_batch_with_anthropic,
     verify_batch_with_gemini,
-    verify_batch_with_deepseek
+    verify_batch_with_deepseek,
+    averify_batch_with_openai,
+    averify_batch_with_anthropic,
+    averify_batch_with_gemini,
+    averify_batch_with_deepseek,
 )
 
 # Priority order for factual verification (from research)
@@ -22,6 +27,14 @@ LLM_VERIFIERS = {
     "deepseek": verify_batch_with_deepseek,
 }
 
+# Async counterparts used by the FastAPI handler
+ASYNC_LLM_VERIFIERS = {
+    "openai": averify_batch_with_openai,
+    "anthropic": averify_batch_with_anthropic,
+    "gemini": averify_batch_with_gemini,
+    "deepseek": averify_batch_with_deepseek,
+}
+
 
 class PrioritizedVotingSystem:
     """
@@ -31,6 +44,7 @@ class PrioritizedVotingSystem:
     def __init__(self):
         self.priority_order = LLM_PRIORITY_ORDER
         self.verifiers = LLM_VERIFIERS
+        self.async_verifiers = ASYNC_LLM_VERIFIERS
     
     def get_verification_llms(self, target_llm: str) -> List[str]:
         """
@@ -58,7 +72,7 @@ class PrioritizedVotingSystem:
         self, 
         claims: List[str], 
         target_llm: str = "mistral"
-    ) -> List[Dict[str, str]]:
+    ) -> Tuple[List[Dict[str, str]], Tuple[str, ...]]:
         """
         Verify claims using prioritized LLM voting system.
         
@@ -75,16 +89,13 @@ class PrioritizedVotingSystem:
             target_llm: The target LLM being tested
         
         Returns:
-            List of dictionaries with verification results for each claim
+            Tuple of (verification result dict for each claim, names of the LLMs
+            that were actually called, in call order)
         """
         if not claims:
-            return []
+            return [], ()
         
-        # Get prioritized verification LLMs
-        verification_llms = self.get_verification_llms(target_llm)
-        
-        if len(verification_llms) < 2:
-            raise ValueError("Need at least 2 LLMs for verification")
+        verification_llms = self._get_required_verification_llms(target_llm)
         
         # Step 1: Get verifications from first two LLMs
         llm1_name = verification_llms[0]
@@ -95,6 +106,88 @@ class PrioritizedVotingSystem:
         llm2_results = self.verifiers[llm2_name](claims)
         
         # Step 2: Compare results and identify conflicts
+        results, contradicted_indices = self._compare_primary_results(
+            claims, llm1_name, llm1_results, llm2_name, llm2_results
+        )
+        
+        # Step 3: Resolve contradictions with third LLM
+        if contradicted_indices and len(verification_llms) >= 3:
+            llm3_name = verification_llms[2]
+            contradicted_claims = [claims[i] for i in contradicted_indices]
+            
+            print(f"Resolving {len(contradicted_claims)} contradictions with {llm3_name}...")
+            llm3_results = self.verifiers[llm3_name](contradicted_claims)
+            self._apply_third_llm_results(results, contradicted_indices, llm3_name, llm3_results)
+            return results, (llm1_name, llm2_name, llm3_name)
+        
+        return results, (llm1_name, llm2_name)
+    
+    async def averify_claims_with_voting(
+        self, 
+        claims: List[str], 
+        target_llm: str = "mistral"
+    ) -> Tuple[List[Dict[str, str]], Tuple[str, ...]]:
+        """
+        Async variant of verify_claims_with_voting.
+        
+        Same voting process, but awaits the async verifiers so the calling
+        event loop is not blocked while the providers respond, and runs the
+        first two verifiers concurrently.
+        """
+        if not claims:
+            return [], ()
+        
+        verification_llms = self._get_required_verification_llms(target_llm)
+        
+        llm1_name = verification_llms[0]
+        llm2_name = verification_llms[1]
+        
+        # Both primary verifiers are independent, so dispatch them together and
+        # let the slower provider set the wall time instead of the sum of both
+        print(f"Verifying with {llm1_name} and {llm2_name}...")
+        llm1_results, llm2_results = await asyncio.gather(
+            self.async_verifiers[llm1_name](claims),
+            self.async_verifiers[llm2_name](claims),
+        )
+        
+        results, contradicted_indices = self._compare_primary_results(
+            claims, llm1_name, llm1_results, llm2_name, llm2_results
+        )
+        
+        if contradicted_indices and len(verification_llms) >= 3:
+            llm3_name = verification_llms[2]
+            contradicted_claims = [claims[i] for i in contradicted_indices]
+            
+            print(f"Resolving {len(contradicted_claims)} contradictions with {llm3_name}...")
+            llm3_results = await self.async_verifiers[llm3_name](contradicted_claims)
+            self._apply_third_llm_results(results, contradicted_indices, llm3_name, llm3_results)
+            return results, (llm1_name, llm2_name, llm3_name)
+        
+        return results, (llm1_name, llm2_name)
+    
+    def _get_required_verification_llms(self, target_llm: str) -> List[str]:
+        """Get prioritized verification LLMs, ensuring at least two are available"""
+        verification_llms = self.get_verification_llms(target_llm)
+        
+        if len(verification_llms) < 2:
+            raise ValueError("Need at least 2 LLMs for verification")
+        
+        return verification_llms
+    
+    def _compare_primary_results(
+        self,
+        claims: List[str],
+        llm1_name: str,
+        llm1_results: List[str],
+        llm2_name: str,
+        llm2_results: List[str]
+    ) -> Tuple[List[Dict[str, str]], List[int]]:
+        """
+        Build per-claim results from the first two LLMs.
+        
+        Returns:
+            Tuple of (results, indices of claims where the two LLMs contradict)
+        """
         results = []
         contradicted_indices = []
         
@@ -135,31 +228,30 @@ class PrioritizedVotingSystem:
                     "voting_used": True
                 })
         
-        # Step 3: Resolve contradictions with third LLM
-        if contradicted_indices and len(verification_llms) >= 3:
-            llm3_name = verification_llms[2]
-            contradicted_claims = [claims[i] for i in contradicted_indices]
+        return results, contradicted_indices
+    
+    def _apply_third_llm_results(
+        self,
+        results: List[Dict[str, str]],
+        contradicted_indices: List[int],
+        llm3_name: str,
+        llm3_results: List[str]
+    ) -> None:
+        """Fill in the third LLM's verdicts and apply voting to contradicted claims"""
+        for idx, global_idx in enumerate(contradicted_indices):
+            result1 = results[global_idx]["llm1_result"]
+            result2 = results[global_idx]["llm2_result"]
+            result3 = self._normalize_response(
+                llm3_results[idx] if idx < len(llm3_results) else "Uncertain"
+            )
             
-            print(f"Resolving {len(contradicted_claims)} contradictions with {llm3_name}...")
-            llm3_results = self.verifiers[llm3_name](contradicted_claims)
+            # Update with third LLM result
+            results[global_idx]["llm3_name"] = llm3_name
+            results[global_idx]["llm3_result"] = result3
             
             # Apply voting logic
-            for idx, global_idx in enumerate(contradicted_indices):
-                result1 = results[global_idx]["llm1_result"]
-                result2 = results[global_idx]["llm2_result"]
-                result3 = self._normalize_response(
-                    llm3_results[idx] if idx < len(llm3_results) else "Uncertain"
-                )
-                
-                # Update with third LLM result
-                results[global_idx]["llm3_name"] = llm3_name
-                results[global_idx]["llm3_result"] = result3
-                
-                # Apply voting logic
-                final_verdict = self._apply_voting_logic(result1, result2, result3)
-                results[global_idx]["final_verdict"] = final_verdict
-        
-        return results
+            final_verdict = self._apply_voting_logic(result1, result2, result3)
+            results[global_idx]["final_verdict"] = final_verdict
     
     def _normalize_response(self, response: str) -> Literal["Yes", "No", "Uncertain"]:
         """Normalize LLM response to Yes/No/Uncertain"""
@@ -210,7 +302,7 @@ prioritized_voting_system = PrioritizedVotingSystem()
 def verify_with_prioritized_voting(
     claims: List[str], 
     target_llm: str = "mistral"
-) -> List[Dict[str, str]]:
+) -> Tuple[List[Dict[str, str]], Tuple[str, ...]]:
     """
     Verify claims using the prioritized voting system.
     
@@ -219,6 +311,25 @@ def verify_with_prioritized_voting(
         target_llm: The target LLM being tested
     
     Returns:
-        List of verification results with voting details
+        Tuple of (verification results with voting details, names of the
+        verifier LLMs used)
     """
     return prioritized_voting_system.verify_claims_with_voting(claims, target_llm)
+
+
+async def averify_with_prioritized_voting(
+    claims: List[str], 
+    target_llm: str = "mistral"
+) -> Tuple[List[Dict[str, str]], Tuple[str, ...]]:
+    """
+    Async variant of verify_with_prioritized_voting.
+    
+    Args:
+        claims: List of factual claims to verify
+        target_llm: The target LLM being tested
+    
+    Returns:
+        Tuple of (verification results with voting details, names of the
+        verifier LLMs used)
+    """
+    return await prioritized_voting_system.averify_claims_with_voting(claims, target_llm)
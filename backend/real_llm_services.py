@@ -6,17 +6,38 @@ Real LLM Service implementations using actual APIs
 """
 
 import os
-import json
 import re
+import json
+import hashlib
 import time
+import asyncio
+import threading
 from typing import List, Dict, Literal, Optional
 from config import Config
 
 # Import API clients
 import openai
 import google.generativeai as genai
+from google.generativeai import client as genai_client
 from mistralai import Mistral
-from anthropic import Anthropic
+from anthropic import Anthropic, AsyncAnthropic
+
+# Optional - only needed for the shared Redis response cache
+try:
+    import redis.asyncio as aioredis
+except ImportError:
+    aioredis = None
+
+# Optional - only needed for the semantic claim cache
+try:
+    import numpy as np
+    from sentence_transformers import SentenceTransformer
+except ImportError:
+    np = None
+    SentenceTransformer = None
+
+# Output tokens budgeted per claim in a batched verification request
+VERIFICATION_TOKENS_PER_CLAIM = 8
 
 
 class RealLLMService:
@@ -41,6 +62,14 @@ class RealLLMService:
             base_url="https://api.deepseek.com"
         )
         
+        # Async clients for the FastAPI path (Gemini and Mistral expose async methods directly)
+        self.async_openai_client = openai.AsyncOpenAI(api_key=Config.OPENAI_API_KEY)
+        self.async_anthropic_client = AsyncAnthropic(api_key=Config.ANTHROPIC_API_KEY)
+        self.async_deepseek_client = openai.AsyncOpenAI(
+            api_key=Config.DEEPSEEK_API_KEY,
+            base_url="https://api.deepseek.com"
+        )
+        
     def get_target_response(self, prompt: str, target: str = "mistral") -> str:
         """Get response from the selected target LLM with graceful fallback."""
         target_key = (target or "mistral").lower()
@@ -109,17 +138,7 @@ class RealLLMService:
     
     def extract_claims_with_gemini(self, text: str) -> List[str]:
         """Extract claims using Google Gemini"""
-        prompt = f"""Extract each factual claim in the following paragraph. Return them as a numbered list.
-Only include statements that can be verified as true or false facts (dates, names, places, events, etc.).
-Exclude opinions, questions, or subjective statements.
-
-Text: {text}
-
-Format your response as:
-1. [First factual claim]
-2. [Second factual claim]
-3. [Third factual claim]
-etc."""
+        prompt = self._build_extraction_prompt(text)
 
         try:
             response = self.gemini_model.generate_content(
@@ -139,17 +158,7 @@ etc."""
     
     def extract_claims_with_mistral(self, text: str) -> List[str]:
         """Extract claims using Mistral API"""
-        prompt = f"""Extract each factual claim in the following paragraph. Return them as a numbered list.
-Only include statements that can be verified as true or false facts (dates, names, places, events, etc.).
-Exclude opinions, questions, or subjective statements.
-
-Text: {text}
-
-Format your response as:
-1. [First factual claim]
-2. [Second factual claim]
-3. [Third factual claim]
-etc."""
+        prompt = self._build_extraction_prompt(text)
 
         try:
             response = self.mistral_client.chat.complete(
@@ -168,17 +177,7 @@ etc."""
     
     def extract_claims_with_openai(self, text: str) -> List[str]:
         """Extract claims using OpenAI"""
-        prompt = f"""Extract each factual claim in the following paragraph. Return them as a numbered list.
-Only include statements that can be verified as true or false facts (dates, names, places, events, etc.).
-Exclude opinions, questions, or subjective statements.
-
-Text: {text}
-
-Format your response as:
-1. [First factual claim]
-2. [Second factual claim]
-3. [Third factual claim]
-etc."""
+        prompt = self._build_extraction_prompt(text)
 
         try:
             response = self.openai_client.chat.completions.create(
@@ -197,33 +196,17 @@ etc."""
     
     def verify_claims_with_openai(self, claims: List[str]) -> List[str]:
         """Verify claims using OpenAI o1-preview"""
-        claims_text = "\n".join([f"{i+1}. {claim}" for i, claim in enumerate(claims)])
-        
-        prompt = f"""For each claim below, respond with ONLY one word: "Yes", "No", or "Uncertain"
-
-Yes = the claim is factually correct according to widely accepted knowledge
-No = the claim is factually incorrect 
-Uncertain = the claim is ambiguous, partially true, or you're not confident
-
-Claims:
-{claims_text}
-
-Response format:
-1. [Yes/No/Uncertain]
-2. [Yes/No/Uncertain]
-3. [Yes/No/Uncertain]
-etc."""
-
-        try:
+        def ask(prompt: str, max_tokens: int) -> str:
             response = self.openai_client.chat.completions.create(
                 model=Config.LLM1_MODEL,  # o1-preview
                 messages=[{"role": "user", "content": prompt}],
                 temperature=0.1,
-                max_tokens=200
+                max_tokens=max_tokens
             )
-            
-            verification_text = response.choices[0].message.content
-            return self._parse_verification_responses(verification_text, len(claims))
+            return response.choices[0].message.content
+
+        try:
+            return self._verify_in_batch(claims, ask)
             
         except Exception as e:
             print(f"OpenAI verification error: {e}")
@@ -231,34 +214,18 @@ etc."""
     
     def verify_claims_with_gemini(self, claims: List[str]) -> List[str]:
         """Verify claims using Google Gemini (LLM1)"""
-        claims_text = "\n".join([f"{i+1}. {claim}" for i, claim in enumerate(claims)])
-        
-        prompt = f"""For each claim below, respond with ONLY one word: "Yes", "No", or "Uncertain"
-
-Yes = the claim is factually correct according to widely accepted knowledge
-No = the claim is factually incorrect 
-Uncertain = the claim is ambiguous, partially true, or you're not confident
-
-Claims:
-{claims_text}
-
-Response format:
-1. [Yes/No/Uncertain]
-2. [Yes/No/Uncertain]
-3. [Yes/No/Uncertain]
-etc."""
-
-        try:
+        def ask(prompt: str, max_tokens: int) -> str:
             response = self.gemini_model.generate_content(
                 prompt,
                 generation_config=genai.types.GenerationConfig(
                     temperature=0.1,
-                    max_output_tokens=200,
+                    max_output_tokens=max_tokens,
                 )
             )
-            
-            verification_text = response.text
-            return self._parse_verification_responses(verification_text, len(claims))
+            return response.text
+
+        try:
+            return self._verify_in_batch(claims, ask)
             
         except Exception as e:
             print(f"Gemini verification error: {e}")
@@ -266,43 +233,254 @@ etc."""
     
     def verify_claims_with_deepseek(self, claims: List[str]) -> List[str]:
         """Verify claims using deepseek-chat"""
-        claims_text = "\n".join([f"{i+1}. {claim}" for i, claim in enumerate(claims)])
-        
-        prompt = f"""For each claim below, respond with ONLY one word: "Yes", "No", or "Uncertain"
+        def ask(prompt: str, max_tokens: int) -> str:
+            response = self.deepseek_client.chat.completions.create(
+                model=Config.LLM2_MODEL,
+                messages=[{"role": "user", "content": prompt}],
+                temperature=0.1,
+                max_tokens=max_tokens
+            )
+            return response.choices[0].message.content
 
-Yes = the claim is factually correct according to widely accepted knowledge
-No = the claim is factually incorrect 
-Uncertain = the claim is ambiguous, partially true, or you're not confident
+        try:
+            return self._verify_in_batch(claims, ask)
+            
+        except Exception as e:
+            print(f"DeepSeek verification error: {e}")
+            return ["Uncertain"] * len(claims)
+    
+    def verify_claims_with_anthropic(self, claims: List[str]) -> List[str]:
+        """Verify claims using Anthropic Claude"""
+        def ask(prompt: str, max_tokens: int) -> str:
+            response = self.anthropic_client.messages.create(
+                model="claude-3-haiku-20240307",  # Using Haiku - faster and more cost-effective
+                max_tokens=max_tokens,
+                temperature=0.1,
+                messages=[
+                    {"role": "user", "content": prompt}
+                ]
+            )
+            return response.content[0].text
 
-Claims:
-{claims_text}
+        try:
+            return self._verify_in_batch(claims, ask)
+            
+        except Exception as e:
+            print(f"Anthropic verification error: {e}")
+            return ["Uncertain"] * len(claims)
+    
+    async def aget_target_response(self, prompt: str, target: str = "mistral") -> str:
+        """Async variant of get_target_response using the providers' async clients"""
+        target_key = (target or "mistral").lower()
 
-Response format:
-1. [Yes/No/Uncertain]
-2. [Yes/No/Uncertain]
-3. [Yes/No/Uncertain]
-etc."""
+        if target_key == "openai":
+            try:
+                response = await self.async_openai_client.chat.completions.create(
+                    model=Config.LLM1_MODEL,
+                    messages=[{"role": "user", "content": prompt}],
+                    temperature=0.7,
+                    max_tokens=500
+                )
+                return response.choices[0].message.content
+            except Exception as exc:
+                print(f"OpenAI target error: {exc}")
+                target_key = "mistral"
+        elif target_key == "gemini":
+            try:
+                response = await self.gemini_model.generate_content_async(
+                    prompt,
+                    generation_config=genai.types.GenerationConfig(
+                        temperature=0.7,
+                        max_output_tokens=500,
+                    )
+                )
+                return response.text
+            except Exception as exc:
+                print(f"Gemini target error: {exc}")
+                target_key = "mistral"
+        elif target_key == "anthropic":
+            try:
+                response = await self.async_anthropic_client.messages.create(
+                    model="claude-3-haiku-20240307",
+                    max_tokens=500,
+                    temperature=0.7,
+                    messages=[{"role": "user", "content": prompt}]
+                )
+                return response.content[0].text
+            except Exception as exc:
+                print(f"Anthropic target error: {exc}")
+                target_key = "mistral"
+        elif target_key == "deepseek":
+            try:
+                response = await self.async_deepseek_client.chat.completions.create(
+                    model=Config.LLM2_MODEL,
+                    messages=[{"role": "user", "content": prompt}],
+                    temperature=0.7,
+                    max_tokens=500
+                )
+                return response.choices[0].message.content
+            except Exception as exc:
+                print(f"DeepSeek target error: {exc}")
+                target_key = "mistral"
 
         try:
-            response = self.deepseek_client.chat.completions.create(
-                model=Config.LLM2_MODEL,
+            response = await self.mistral_client.chat.complete_async(
+                model=Config.TARGET_MODEL,
+                messages=[{"role": "user", "content": prompt}],
+                temperature=0.7,
+                max_tokens=500
+            )
+            return response.choices[0].message.content
+        except Exception as exc:
+            print(f"Mistral fallback error: {exc}")
+            return f"Error getting response from target LLM: {exc}"
+    
+    async def aextract_claims_with_openai(self, text: str) -> List[str]:
+        """Async variant of extract_claims_with_openai"""
+        prompt = self._build_extraction_prompt(text)
+
+        try:
+            response = await self.async_openai_client.chat.completions.create(
+                model="gpt-4o-mini",
+                messages=[{"role": "user", "content": prompt}],
+                temperature=0.2,
+                max_tokens=400
+            )
+            return self._parse_numbered_list(response.choices[0].message.content)
+            
+        except Exception as e:
+            print(f"OpenAI extraction error: {e}")
+            return ["Error extracting claims"]
+    
+    async def averify_claims_with_openai(self, claims: List[str]) -> List[str]:
+        """Async variant of verify_claims_with_openai"""
+        async def ask(prompt: str, max_tokens: int) -> str:
+            response = await self.async_openai_client.chat.completions.create(
+                model=Config.LLM1_MODEL,
                 messages=[{"role": "user", "content": prompt}],
                 temperature=0.1,
-                max_tokens=200
+                max_tokens=max_tokens
             )
+            return response.choices[0].message.content
+
+        try:
+            return await self._averify_in_batch(claims, ask)
             
-            verification_text = response.choices[0].message.content
-            return self._parse_verification_responses(verification_text, len(claims))
+        except Exception as e:
+            print(f"OpenAI verification error: {e}")
+            return ["Uncertain"] * len(claims)
+    
+    async def averify_claims_with_gemini(self, claims: List[str]) -> List[str]:
+        """Async variant of verify_claims_with_gemini"""
+        async def ask(prompt: str, max_tokens: int) -> str:
+            response = await self.gemini_model.generate_content_async(
+                prompt,
+                generation_config=genai.types.GenerationConfig(
+                    temperature=0.1,
+                    max_output_tokens=max_tokens,
+                )
+            )
+            return response.text
+
+        try:
+            return await self._averify_in_batch(claims, ask)
+            
+        except Exception as e:
+            print(f"Gemini verification error: {e}")
+            return ["Uncertain"] * len(claims)
+    
+    async def averify_claims_with_deepseek(self, claims: List[str]) -> List[str]:
+        """Async variant of verify_claims_with_deepseek"""
+        async def ask(prompt: str, max_tokens: int) -> str:
+            response = await self.async_deepseek_client.chat.completions.create(
+                model=Config.LLM2_MODEL,
+                messages=[{"role": "user", "content": prompt}],
+                temperature=0.1,
+                max_tokens=max_tokens
+            )
+            return response.choices[0].message.content
+
+        try:
+            return await self._averify_in_batch(claims, ask)
             
         except Exception as e:
             print(f"DeepSeek verification error: {e}")
             return ["Uncertain"] * len(claims)
     
-    def verify_claims_with_anthropic(self, claims: List[str]) -> List[str]:
-        """Verify claims using Anthropic Claude"""
+    async def averify_claims_with_anthropic(self, claims: List[str]) -> List[str]:
+        """Async variant of verify_claims_with_anthropic"""
+        async def ask(prompt: str, max_tokens: int) -> str:
+            response = await self.async_anthropic_client.messages.create(
+                model="claude-3-haiku-20240307",
+                max_tokens=max_tokens,
+                temperature=0.1,
+                messages=[{"role": "user", "content": prompt}]
+            )
+            return response.content[0].text
+
+        try:
+            return await self._averify_in_batch(claims, ask)
+            
+        except Exception as e:
+            print(f"Anthropic verification error: {e}")
+            return ["Uncertain"] * len(claims)
+    
+    def _verify_in_batch(self, claims: List[str], ask) -> List[str]:
+        """
+        Verify all claims in one request; if the reply covers fewer claims than
+        were asked (usually a truncated list), ask once more for the rest
+        """
+        verdicts = self._parse_verdicts(ask(self._build_verification_prompt(claims), self._verification_max_tokens(len(claims))))
+        missing = claims[len(verdicts):]
+        if missing:
+            verdicts += self._parse_verdicts(ask(self._build_verification_prompt(missing), self._verification_max_tokens(len(missing))))
+        return self._pad_verdicts(verdicts, len(claims))
+    
+    async def _averify_in_batch(self, claims: List[str], ask) -> List[str]:
+        """Async variant of _verify_in_batch"""
+        verdicts = self._parse_verdicts(await ask(self._build_verification_prompt(claims), self._verification_max_tokens(len(claims))))
+        missing = claims[len(verdicts):]
+        if missing:
+            verdicts += self._parse_verdicts(await ask(self._build_verification_prompt(missing), self._verification_max_tokens(len(missing))))
+        return self._pad_verdicts(verdicts, len(claims))
+    
+    def _verification_max_tokens(self, claim_count: int) -> int:
+        """Output budget for a batch - a numbered verdict line costs a few tokens"""
+        return max(200, VERIFICATION_TOKENS_PER_CLAIM * claim_count)
+    
+    async def aclose(self) -> None:
+        """Close the connection pools held by the async clients"""
+        closers = [
+            self.async_openai_client.close(),
+            self.async_deepseek_client.close(),
+            self.async_anthropic_client.close(),
+            # Mistral's async httpx pool is released by its async context-manager exit
+            self.mistral_client.__aexit__(None, None, None),
+        ]
+        # generate_content_async runs on the SDK's shared default async client;
+        # its gRPC channel only connects on first use, so fetching it here is cheap
+        closers.append(genai_client.get_default_generative_async_client().transport.close())
+        await asyncio.gather(*closers)
+    
+    def _build_extraction_prompt(self, text: str) -> str:
+        """Prompt asking for the factual claims in text as a numbered list"""
+        return f"""Extract each factual claim in the following paragraph. Return them as a numbered list.
+Only include statements that can be verified as true or false facts (dates, names, places, events, etc.).
+Exclude opinions, questions, or subjective statements.
+
+Text: {text}
+
+Format your response as:
+1. [First factual claim]
+2. [Second factual claim]
+3. [Third factual claim]
+etc."""
+    
+    def _build_verification_prompt(self, claims: List[str]) -> str:
+        """Prompt asking for a Yes/No/Uncertain verdict per numbered claim"""
         claims_text = "\n".join([f"{i+1}. {claim}" for i, claim in enumerate(claims)])
         
-        prompt = f"""For each claim below, respond with ONLY one word: "Yes", "No", or "Uncertain"
+        return f"""For each claim below, respond with ONLY one word: "Yes", "No", or "Uncertain"
 
 Yes = the claim is factually correct according to widely accepted knowledge
 No = the claim is factually incorrect 
@@ -316,23 +494,6 @@ Response format:
 2. [Yes/No/Uncertain]
 3. [Yes/No/Uncertain]
 etc."""
-
-        try:
-            response = self.anthropic_client.messages.create(
-                model="claude-3-haiku-20240307",  # Using Haiku - faster and more cost-effective
-                max_tokens=200,
-                temperature=0.1,
-                messages=[
-                    {"role": "user", "content": prompt}
-                ]
-            )
-            
-            verification_text = response.content[0].text
-            return self._parse_verification_responses(verification_text, len(claims))
-            
-        except Exception as e:
-            print(f"Anthropic verification error: {e}")
-            return ["Uncertain"] * len(claims)
     
     def _parse_numbered_list(self, text: str) -> List[str]:
         """Parse numbered list from LLM response"""
@@ -350,8 +511,8 @@ etc."""
         
         return claims if claims else [text.strip()]
     
-    def _parse_verification_responses(self, text: str, expected_count: int) -> List[str]:
-        """Parse verification responses from LLM"""
+    def _parse_verdicts(self, text: str) -> List[str]:
+        """Parse the numbered verdict lines from an LLM verification response"""
         verifications = []
         lines = text.strip().split('\n')
         
@@ -369,51 +530,258 @@ etc."""
                 else:
                     verifications.append('Uncertain')
         
-        # Ensure we have the right number of responses
-        while len(verifications) < expected_count:
-            verifications.append('Uncertain')
-        
-        return verifications[:expected_count]
+        return verifications
+    
+    def _pad_verdicts(self, verifications: List[str], expected_count: int) -> List[str]:
+        """Return exactly expected_count verdicts, Uncertain for any left unanswered"""
+        verifications = verifications[:expected_count]
+        return verifications + ['Uncertain'] * (expected_count - len(verifications))
 
 
 # Global instance
 real_llm_service = RealLLMService()
 
 
+# Response caches - identical questions and duplicate claims (demos, retries,
+# claims shared between answers) are served without another paid API call
+CACHE_SIZE = 4096
+_response_cache: Dict[tuple, object] = {}
+_verdict_cache: Dict[str, Dict[str, str]] = {}
+_cache_lock = threading.Lock()
+
+
+def _remember(cache: Dict, key, value) -> None:
+    """Store a value, dropping the oldest entry once the cache is full"""
+    with _cache_lock:
+        if key not in cache and len(cache) >= CACHE_SIZE:
+            cache.pop(next(iter(cache)))
+        cache[key] = value
+
+
+class SharedResponseCache:
+    """
+    Redis tier behind the in-process caches, so every uvicorn worker (and
+    restarts) can reuse responses. Redis errors only cost a cache miss
+    """
+    
+    def __init__(self, url: str, ttl: int):
+        self.ttl = ttl
+        self._client = aioredis.from_url(url, decode_responses=True)
+    
+    def _redis_key(self, key: tuple) -> str:
+        digest = hashlib.sha256(json.dumps(key).encode("utf-8")).hexdigest()
+        return f"hallucination-detector:{key[0]}:{digest}"
+    
+    async def get(self, key: tuple) -> Optional[str]:
+        try:
+            return await self._client.get(self._redis_key(key))
+        except Exception as exc:
+            print(f"Redis cache read error: {exc}")
+            return None
+    
+    async def set(self, key: tuple, value: str) -> None:
+        try:
+            await self._client.set(self._redis_key(key), value, ex=self.ttl)
+        except Exception as exc:
+            print(f"Redis cache write error: {exc}")
+    
+    async def aclose(self) -> None:
+        await self._client.aclose()
+
+
+if Config.REDIS_URL and aioredis is None:
+    print("Warning: REDIS_URL is set but the redis package is not installed")
+
+shared_response_cache = (
+    SharedResponseCache(Config.REDIS_URL, Config.CACHE_TTL_SECONDS)
+    if Config.REDIS_URL and aioredis is not None
+    else None
+)
+
+
+def _target_cache_key(prompt: str, target: str) -> tuple:
+    return ("target", prompt.strip(), (target or "mistral").lower())
+
+
+def _split_cached_verdicts(provider: str, claims: List[str]):
+    """Return (claim keys, verdicts already cached, unique claims still to verify)"""
+    cache = _verdict_cache.setdefault(provider, {})
+    keys = [claim.strip() for claim in claims]
+    verdicts = {key: cache[key] for key in keys if key in cache}
+    pending = [key for key in dict.fromkeys(keys) if key not in verdicts]
+    return keys, verdicts, pending
+
+
+def _merge_verdicts(provider: str, keys: List[str], verdicts: Dict[str, str], pending: List[str], new_verdicts: List[str]) -> List[str]:
+    """Cache the fresh verdicts and return one verdict per requested claim"""
+    cache = _verdict_cache[provider]
+    for key, verdict in zip(pending, new_verdicts):
+        verdicts[key] = verdict
+        # Provider errors come back as Uncertain, so only definite answers are kept
+        if verdict != "Uncertain":
+            _remember(cache, key, verdict)
+
+    return [verdicts.get(key, "Uncertain") for key in keys]
+
+
+def _verify_with_cache(provider: str, claims: List[str], verify_fn) -> List[str]:
+    """
+    Verify only the claims this provider has not answered before, in one batch,
+    and fill in the rest from the verdict cache
+    """
+    keys, verdicts, pending = _split_cached_verdicts(provider, claims)
+    new_verdicts = verify_fn(pending) if pending else []
+    return _merge_verdicts(provider, keys, verdicts, pending, new_verdicts)
+
+
+async def _averify_with_cache(provider: str, claims: List[str], averify_fn) -> List[str]:
+    """Async variant of _verify_with_cache"""
+    keys, verdicts, pending = _split_cached_verdicts(provider, claims)
+    new_verdicts = await _single_flight(("verify", provider, *pending), lambda: averify_fn(pending)) if pending else []
+    return _merge_verdicts(provider, keys, verdicts, pending, new_verdicts)
+
+
+# Provider calls currently running on this worker's event loop, by cache key
+_inflight: Dict[tuple, asyncio.Task] = {}
+
+
+async def _single_flight(key: tuple, make_call):
+    """
+    Join the running call for key if there is one, otherwise start it, so
+    concurrent identical requests share one provider round trip. The call is
+    shielded: a caller that disconnects does not cancel it for the others
+    """
+    task = _inflight.get(key)
+    if task is None:
+        task = asyncio.ensure_future(make_call())
+        _inflight[key] = task
+        task.add_done_callback(lambda _: _inflight.pop(key, None))
+    return await asyncio.shield(task)
+
+
+class SemanticClaimCache:
+    """
+    Claims cache keyed by response embeddings: a response whose cosine
+    similarity to a cached one reaches the threshold reuses its claims
+    """
+    
+    def __init__(self, model_name: str, threshold: float, max_entries: int):
+        self.model_name = model_name
+        self.threshold = threshold
+        self.max_entries = max_entries
+        self._model = None
+        self._embeddings = None  # (n, dim) array of normalized embeddings
+        self._claims: List[tuple] = []
+        self._last_used = None  # access tick per row, the lowest is evicted first
+        self._tick = 0
+        self._lock = threading.Lock()
+    
+    def _encode(self, text: str):
+        if self._model is None:
+            self._model = SentenceTransformer(self.model_name)
+        return self._model.encode([text], normalize_embeddings=True)[0].astype(np.float32)
+    
+    def lookup(self, text: str):
+        """Return (cached claims or None, embedding of text)"""
+        embedding = self._encode(text)
+        with self._lock:
+            if self._embeddings is None:
+                return None, embedding
+            similarities = self._embeddings @ embedding
+            best = int(similarities.argmax())
+            if similarities[best] < self.threshold:
+                return None, embedding
+            self._tick += 1
+            self._last_used[best] = self._tick
+            return list(self._claims[best]), embedding
+    
+    def store(self, embedding, claims: List[str]) -> None:
+        with self._lock:
+            self._tick += 1
+            if self._embeddings is None:
+                self._embeddings = embedding[np.newaxis, :]
+                self._last_used = np.array([self._tick])
+                self._claims = [tuple(claims)]
+            elif len(self._claims) >= self.max_entries:
+                # Overwrite the least recently used row in place
+                row = int(self._last_used.argmin())
+                self._embeddings[row] = embedding
+                self._last_used[row] = self._tick
+                self._claims[row] = tuple(claims)
+            else:
+                self._embeddings = np.vstack([self._embeddings, embedding])
+                self._last_used = np.append(self._last_used, self._tick)
+                self._claims.append(tuple(claims))
+
+
+if Config.SEMANTIC_CACHE_ENABLED and SentenceTransformer is None:
+    print("Warning: SEMANTIC_CACHE_ENABLED is set but sentence-transformers is not installed")
+
+semantic_claim_cache = (
+    SemanticClaimCache(Config.SEMANTIC_CACHE_MODEL, Config.SEMANTIC_CACHE_THRESHOLD, Config.SEMANTIC_CACHE_SIZE)
+    if Config.SEMANTIC_CACHE_ENABLED and SentenceTransformer is not None
+    else None
+)
+
+
 # Legacy compatibility functions
 def get_target_response(prompt: str, target: str = "mistral") -> str:
     """Get target LLM response for the requested provider."""
-    return real_llm_service.get_target_response(prompt, target)
+    key = _target_cache_key(prompt, target)
+    cached = _response_cache.get(key)
+    if cached is not None:
+        return cached
+
+    response = real_llm_service.get_target_response(prompt, target)
+    if not response.startswith("Error getting response"):
+        _remember(_response_cache, key, response)
+    return response
 
 
 def extract_claims_with_llm(text: str, provider: str = "openai") -> List[str]:
     """Extract claims using OpenAI (best performing for claim extraction)"""
-    return real_llm_service.extract_claims_with_openai(text)
+    key = ("claims", text.strip())
+    cached = _response_cache.get(key)
+    if cached is not None:
+        return list(cached)
+
+    embedding = None
+    if semantic_claim_cache is not None:
+        cached, embedding = semantic_claim_cache.lookup(text)
+        if cached is not None:
+            return cached
+
+    claims = real_llm_service.extract_claims_with_openai(text)
+    if claims != ["Error extracting claims"]:
+        _remember(_response_cache, key, tuple(claims))
+        if embedding is not None:
+            semantic_claim_cache.store(embedding, claims)
+    return claims
 
 
 def verify_batch_with_llm1(claims: List[str]) -> List[str]:
     """Verify claims with LLM1 (Gemini)"""
-    return real_llm_service.verify_claims_with_gemini(claims)
+    return _verify_with_cache("gemini", claims, real_llm_service.verify_claims_with_gemini)
 
 
 def verify_batch_with_gemini(claims: List[str]) -> List[str]:
     """Verify claims with Gemini (LLM1)"""
-    return real_llm_service.verify_claims_with_gemini(claims)
+    return _verify_with_cache("gemini", claims, real_llm_service.verify_claims_with_gemini)
 
 
 def verify_batch_with_openai(claims: List[str]) -> List[str]:
     """Verify claims with OpenAI (LLM1)"""
-    return real_llm_service.verify_claims_with_openai(claims)
+    return _verify_with_cache("openai", claims, real_llm_service.verify_claims_with_openai)
 
 
 def verify_batch_with_deepseek(claims: List[str]) -> List[str]:
     """Verify claims with LLM2 (DeepSeek)"""
-    return real_llm_service.verify_claims_with_deepseek(claims)
+    return _verify_with_cache("deepseek", claims, real_llm_service.verify_claims_with_deepseek)
 
 
 def verify_batch_with_anthropic(claims: List[str]) -> List[str]:
     """Verify claims with Anthropic Claude"""
-    return real_llm_service.verify_claims_with_anthropic(claims)
+    return _verify_with_cache("anthropic", claims, real_llm_service.verify_claims_with_anthropic)
 
 
 def verify_batch_with_llm(claims: List[str], provider: str = "openai") -> List[str]:
@@ -426,4 +794,94 @@ def verify_batch_with_llm(claims: List[str], provider: str = "openai") -> List[s
     elif provider_lower == "deepseek":
         return verify_batch_with_deepseek(claims)
     else:
-        return verify_batch_with_openai(claims)
\ No newline at end of file
+        return verify_batch_with_openai(claims)
+
+
+async def aclose_clients() -> None:
+    """Close the pooled provider connections and the Redis client (app shutdown)"""
+    await real_llm_service.aclose()
+    if shared_response_cache is not None:
+        await shared_response_cache.aclose()
+
+
+# Async counterparts for the FastAPI handler - these await the providers' async
+# clients directly, sharing the caches with the sync functions above
+async def aget_target_response(prompt: str, target: str = "mistral") -> str:
+    """Async variant of get_target_response"""
+    key = _target_cache_key(prompt, target)
+    cached = _response_cache.get(key)
+    if cached is not None:
+        return cached
+    return await _single_flight(key, lambda: _aload_target_response(prompt, target, key))
+
+
+async def _aload_target_response(prompt: str, target: str, key: tuple) -> str:
+    """Fill a target response cache miss from Redis or the provider"""
+    if shared_response_cache is not None:
+        cached = await shared_response_cache.get(key)
+        if cached is not None:
+            _remember(_response_cache, key, cached)
+            return cached
+
+    response = await real_llm_service.aget_target_response(prompt, target)
+    if not response.startswith("Error getting response"):
+        _remember(_response_cache, key, response)
+        if shared_response_cache is not None:
+            await shared_response_cache.set(key, response)
+    return response
+
+
+async def aextract_claims_with_llm(text: str, provider: str = "openai") -> List[str]:
+    """Async variant of extract_claims_with_llm"""
+    key = ("claims", text.strip())
+    cached = _response_cache.get(key)
+    if cached is not None:
+        return list(cached)
+    # Joined callers share the result, so each gets its own list
+    return list(await _single_flight(key, lambda: _aload_claims(text, key)))
+
+
+async def _aload_claims(text: str, key: tuple) -> List[str]:
+    """Fill a claims cache miss from Redis, the semantic cache or the provider"""
+    if shared_response_cache is not None:
+        cached = await shared_response_cache.get(key)
+        if cached is not None:
+            claims = json.loads(cached)
+            _remember(_response_cache, key, tuple(claims))
+            return claims
+
+    embedding = None
+    if semantic_claim_cache is not None:
+        # Embedding the response is CPU work, keep it off the event loop
+        cached, embedding = await asyncio.to_thread(semantic_claim_cache.lookup, text)
+        if cached is not None:
+            return cached
+
+    claims = await real_llm_service.aextract_claims_with_openai(text)
+    if claims != ["Error extracting claims"]:
+        _remember(_response_cache, key, tuple(claims))
+        if shared_response_cache is not None:
+            await shared_response_cache.set(key, json.dumps(claims))
+        if embedding is not None:
+            semantic_claim_cache.store(embedding, claims)
+    return claims
+
+
+async def averify_batch_with_gemini(claims: List[str]) -> List[str]:
+    """Async variant of verify_batch_with_gemini"""
+    return await _averify_with_cache("gemini", claims, real_llm_service.averify_claims_with_gemini)
+
+
+async def averify_batch_with_openai(claims: List[str]) -> List[str]:
+    """Async variant of verify_batch_with_openai"""
+    return await _averify_with_cache("openai", claims, real_llm_service.averify_claims_with_openai)
+
+
+async def averify_batch_with_deepseek(claims: List[str]) -> List[str]:
+    """Async variant of verify_batch_with_deepseek"""
+    return await _averify_with_cache("deepseek", claims, real_llm_service.averify_claims_with_deepseek)
+
+
+async def averify_batch_with_anthropic(claims: List[str]) -> List[str]:
+    """Async variant of verify_batch_with_anthropic"""
+    return await _averify_with_cache("anthropic", claims, real_llm_service.averify_claims_with_anthropic)
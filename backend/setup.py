@@ -62,7 +62,7 @@ def validate_configuration():
     
     from config import config
     
-    # The config will automatically print status in debug mode
+    config.log_status_once()
     
     if config.USE_SIMULATION:
         print("✅ Running in simulation mode - no API keys required")
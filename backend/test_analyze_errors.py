@@ -0,0 +1,64 @@
+"""
+Check that /analyze reports pipeline failures as HTTP 500 instead of an empty 200
+The LLM calls are replaced with local coroutines, no API calls are made
+"""
+
+import os
+
+# The provider clients are built on import and need some key, even though none are called here
+for key in ("OPENAI_API_KEY", "GOOGLE_API_KEY", "MISTRAL_API_KEY", "DEEPSEEK_API_KEY"):
+    os.environ.setdefault(key, "placeholder")
+
+from fastapi.testclient import TestClient
+import app
+
+async def fake_target_response(question, target_choice):
+    return "Albert Einstein was born in 1879."
+
+async def failing_extraction(llm_response):
+    raise RuntimeError("extraction service unavailable")
+
+async def fake_extraction(llm_response):
+    return ["Albert Einstein was born in 1879."]
+
+async def fake_voting(claims, target_choice):
+    return [{
+        "claim": claims[0],
+        "llm1_result": "Yes",
+        "llm2_result": "Yes",
+        "llm1_name": "LLM1",
+        "llm2_name": "LLM2",
+        "llm3_name": None,
+        "llm3_result": None,
+        "voting_used": False,
+        "final_verdict": "Yes",
+    }], ["LLM1", "LLM2"]
+
+def test_analyze_error_path():
+    print("🧪 Testing /analyze error reporting")
+    print("=" * 50)
+
+    originals = (app.aget_target_response, app.aextract_claims_with_llm, app.averify_with_prioritized_voting)
+    try:
+        app.aget_target_response = fake_target_response
+        app.averify_with_prioritized_voting = fake_voting
+        client = TestClient(app.app)
+
+        app.aextract_claims_with_llm = failing_extraction
+        response = client.post("/analyze", json={"question": "Who was Einstein?"})
+        assert response.status_code == 500
+        assert "extraction service unavailable" in response.json()["detail"]
+        print("✅ Extraction failure returns HTTP 500")
+
+        app.aextract_claims_with_llm = fake_extraction
+        response = client.post("/analyze", json={"question": "Who was Einstein?"})
+        assert response.status_code == 200
+        data = response.json()
+        assert data["summary"]["verified"] == 1
+        assert data["claims"][0]["id"] == "C1"
+        print("✅ Successful analysis still streams the claims")
+    finally:
+        app.aget_target_response, app.aextract_claims_with_llm, app.averify_with_prioritized_voting = originals
+
+if __name__ == "__main__":
+    test_analyze_error_path()
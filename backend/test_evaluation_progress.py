@@ -0,0 +1,52 @@
+"""
+Check that /api/evaluation-progress is cached until the annotation directory changes
+Runs against a temporary annotation directory, no API calls are made
+"""
+
+import os
+import tempfile
+from pathlib import Path
+
+# The provider clients are built on import and need some key, even though none are called here
+for key in ("OPENAI_API_KEY", "GOOGLE_API_KEY", "MISTRAL_API_KEY", "DEEPSEEK_API_KEY"):
+    os.environ.setdefault(key, "placeholder")
+
+from fastapi.testclient import TestClient
+import app
+
+def test_evaluation_progress_cache():
+    print("🧪 Testing evaluation progress cache")
+    print("=" * 50)
+
+    original_index = app.annotation_index
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            app.annotation_index = app.AnnotationIndex(Path(tmp))
+            app._progress_cache.clear()
+            client = TestClient(app.app)
+
+            first = client.get("/api/evaluation-progress").json()
+            generation = app._progress_cache["generation"]
+            cached = app._progress_cache["result"]
+            assert first["overall"]["completed"] == 0
+
+            # No file changes: the same result object is served again
+            second = client.get("/api/evaluation-progress").json()
+            assert app._progress_cache["result"] is cached
+            assert app._progress_cache["generation"] == generation
+            assert second == first
+            print("✅ Unchanged directory reuses the cached progress")
+
+            # Saving a metrics file bumps the generation and refreshes the cache
+            app.write_json_file(Path(tmp) / "mistral_Q1_metrics.json", {"metrics": {}})
+            third = client.get("/api/evaluation-progress").json()
+            assert app._progress_cache["generation"] > generation
+            assert app._progress_cache["result"] is not cached
+            assert third["per_model"]["mistral"]["completed"] == 1
+            print("✅ Saving a metrics file refreshes the progress")
+    finally:
+        app.annotation_index = original_index
+        app._progress_cache.clear()
+
+if __name__ == "__main__":
+    test_evaluation_progress_cache()
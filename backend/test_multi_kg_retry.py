@@ -0,0 +1,35 @@
+"""
+Check that a Multi-KG lookup which timed out is not cached and is retried
+The SPARQL session is replaced, so no requests leave the machine
+"""
+
+import requests
+
+from multi_kg_service import MultiKGService
+
+def test_timed_out_lookup_is_retried():
+    print("🧪 Testing Multi-KG retry after a timeout")
+    print("=" * 50)
+
+    service = MultiKGService()
+    calls = []
+
+    def timed_out_get(*args, **kwargs):
+        calls.append(kwargs.get("params"))
+        raise requests.Timeout("simulated timeout")
+
+    service.session.get = timed_out_get
+    claim = "Albert Einstein was born in 1879."
+
+    service.verify_claim(claim)
+    first_calls = len(calls)
+    assert first_calls > 0
+    assert service._verdict_cache == {}
+    print("✅ Timed-out verdict was not cached")
+
+    service.verify_claim(claim)
+    assert len(calls) > first_calls
+    print("✅ Second call queried the endpoints again")
+
+if __name__ == "__main__":
+    test_timed_out_lookup_is_retried()
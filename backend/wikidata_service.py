@@ -23,6 +23,9 @@ from typing import Optional, Dict, Literal
 
 WikidataStatus = Literal["Supports", "Contradicts", "Unclear", "NotFound"]
 
+# Years the simulation treats as ambiguous when no specific pattern matched
+AMBIGUOUS_YEAR_RE = re.compile(r"1687|1922|1955")
+
 class WikidataService:
     endpoint = "https://query.wikidata.org/sparql"
     user_agent = "HallucinationDetector/0.1 (test)"
@@ -30,6 +33,9 @@ class WikidataService:
     def __init__(self, use_simulation: bool = True, timeout: int = 15):
         self.use_simulation = use_simulation
         self.timeout = timeout
+        # Keep-alive session shared by all property lookups
+        self.session = requests.Session()
+        self.session.headers["User-Agent"] = self.user_agent
 
     def verify_claim(self, claim: str) -> WikidataStatus:
         # Log the incoming claim
@@ -57,7 +63,7 @@ class WikidataService:
         if "python" in c and "1991" in c:
             return "Supports"
         # Ambiguous
-        if any(y in c for y in ["1687", "1922", "1955"]):
+        if AMBIGUOUS_YEAR_RE.search(c):
             return "Unclear"
         return "NotFound"
 
@@ -142,10 +148,9 @@ class WikidataService:
         # Log the SPARQL query
         print(f"[WikidataService] SPARQL Query for {qid}/{pid}: {query.strip()}")
         try:
-            r = requests.get(
+            r = self.session.get(
                 self.endpoint,
                 params={"query": query, "format": "json"},
-                headers={"User-Agent": self.user_agent},
                 timeout=self.timeout
             )
             if r.status_code != 200:
@@ -3,18 +3,26 @@ Wikipedia integration for external fact verification
 """
 
 import requests
-import json
 import re
-from typing import Dict, Optional, Literal
+import threading
+from typing import Dict, Optional, Literal, Tuple
 from urllib.parse import quote
 
 class WikipediaService:
     """Service for fetching Wikipedia summaries for fact verification"""
     
-    def __init__(self, use_simulation: bool = True):
+    def __init__(self, use_simulation: bool = True, cache_size: int = 1024):
         self.use_simulation = use_simulation
         self.base_url = "https://en.wikipedia.org/api/rest_v1/page/summary/"
         self.search_url = "https://en.wikipedia.org/w/api.php"
+        # Reuse connections for the search + summary requests of every claim
+        self.session = requests.Session()
+        
+        # Fetched summaries keyed by claim text, so repeated claims skip both requests
+        self.cache_size = cache_size
+        self._summary_cache: Dict[str, Dict[str, any]] = {}
+        # Callers fetch summaries concurrently from worker threads
+        self._cache_lock = threading.Lock()
     
     def get_summary_from_wikipedia(self, claim: str) -> Dict[str, any]:
         """
@@ -23,8 +31,21 @@ class WikipediaService:
         """
         if self.use_simulation:
             return self._get_simulated_wikipedia_summary(claim)
-        else:
-            return self._get_real_wikipedia_summary(claim)
+        
+        cache_key = claim.strip()
+        cached = self._summary_cache.get(cache_key)
+        if cached is not None:
+            return cached
+        
+        summary_data, cacheable = self._get_real_wikipedia_summary(claim)
+        # Only cache definite answers - request errors, rate limits and server
+        # errors should be retried next time
+        if cacheable:
+            with self._cache_lock:
+                if cache_key not in self._summary_cache and len(self._summary_cache) >= self.cache_size:
+                    self._summary_cache.pop(next(iter(self._summary_cache)))
+                self._summary_cache[cache_key] = summary_data
+        return summary_data
     
     def verify_claim_with_wikipedia(self, claim: str) -> Literal["Supports", "Contradicts", "Unclear", "NotFound"]:
         """
@@ -58,13 +79,16 @@ class WikipediaService:
             "status": "deprecated"
         }
     
-    def _get_real_wikipedia_summary(self, claim: str) -> Dict[str, any]:
-        """Get actual Wikipedia summary via API"""
+    def _get_real_wikipedia_summary(self, claim: str) -> Tuple[Dict[str, any], bool]:
+        """
+        Get actual Wikipedia summary via API, along with whether the answer is
+        definite enough to cache (found, or missing without a transport failure)
+        """
         try:
             # First, search for the most relevant page
             search_terms = self._extract_search_terms(claim)
             if not search_terms:
-                return {"status": "not_found"}
+                return {"status": "not_found"}, True
             
             # Search for pages
             search_params = {
@@ -75,18 +99,18 @@ class WikipediaService:
                 "srlimit": 1
             }
             
-            search_response = requests.get(self.search_url, params=search_params, timeout=10)
+            search_response = self.session.get(self.search_url, params=search_params, timeout=10)
             search_data = search_response.json()
             
             if not search_data.get("query", {}).get("search"):
-                return {"status": "not_found"}
+                return {"status": "not_found"}, search_response.status_code == 200
             
             # Get the page title
             page_title = search_data["query"]["search"][0]["title"]
             
             # Fetch summary
             summary_url = self.base_url + quote(page_title)
-            summary_response = requests.get(summary_url, timeout=10)
+            summary_response = self.session.get(summary_url, timeout=10)
             
             if summary_response.status_code == 200:
                 summary_data = summary_response.json()
@@ -94,13 +118,14 @@ class WikipediaService:
                     "title": summary_data.get("title", ""),
                     "extract": summary_data.get("extract", ""),
                     "status": "found"
-                }
+                }, True
             else:
-                return {"status": "not_found"}
+                # Only a 404 means the page is really missing
+                return {"status": "not_found"}, summary_response.status_code == 404
                 
         except Exception as e:
             print(f"Wikipedia API error: {e}")
-            return {"status": "error"}
+            return {"status": "error"}, False
     
     def _extract_key_terms(self, claim: str) -> list:
         """Extract key terms from a claim for verification"""
@@ -5,6 +5,8 @@ Run this to see the system in action without the web interface
 
 import sys
 import os
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
 
 # Add backend directory to path
 backend_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'backend')
@@ -40,12 +42,6 @@ if not getattr(config, 'USE_SIMULATION', True):
             "total_claims_extracted": len(claims)
         }
 
-    def verify_with_llm1(claim: str):
-        return real_llm_service.verify_claims_with_gemini([claim])[0]
-
-    def verify_with_llm2(claim: str):
-        return real_llm_service.verify_claims_with_deepseek([claim])[0]
-
     def bulk_verify_claims(claims_list):
         # Separate bulk verification: LLM1 (Gemini) and LLM2 (DeepSeek)
         llm1_results = real_llm_service.verify_claims_with_gemini(claims_list)
@@ -55,9 +51,9 @@ else:
     # Fallback to existing stubbed implementations for offline/demo mode
     from targetllm_stub import get_targetllm_response
     from claimllm_stub import extract_claims_with_claimllm, simulate_claimllm_api_call
-    from claim_verifier_stub import verify_with_llm1, verify_with_llm2, bulk_verify_claims
-from models import ClaimVerification
-from graph_builder import build_hallucination_graph
+    from claim_verifier_stub import bulk_verify_with_llm1, bulk_verify_with_llm2, bulk_verify_claims
+from models import ClaimVerification, RISK_LEVEL_NAMES
+from graph_builder import build_agreement_edges, build_hallucination_graph
 
 # Import confidence scoring system
 try:
@@ -72,6 +68,47 @@ except ImportError:
     WikipediaService = None
     MultiKGService = None
 
+# Upper bound on simultaneous Multi-KG / Wikipedia requests, to respect their rate limits
+MAX_CONCURRENT_EXTERNAL_CHECKS = 5
+
+async def check_claims_externally(verified_claims, multi_kg_service, wiki_service):
+    """
+    Verify medium risk claims with Multi-KG (falling back to Wikipedia) in
+    worker threads, returning the log lines produced for each claim
+    """
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_EXTERNAL_CHECKS)
+    
+    async def check_claim(i, verification):
+        notes = []
+        if not verification.should_check_wikipedia():
+            return notes
+        
+        async with semaphore:
+            external_checked = False
+            # Try Multi-KG consensus first (research-grade approach)
+            if multi_kg_service:
+                try:
+                    kg_status = await asyncio.to_thread(multi_kg_service.verify_claim, verification.claim)
+                    notes.append(f"   � Multi-KG consensus for C{i+1}: {kg_status}")
+                    # Map Multi-KG status into wikipedia_status field to reuse existing logic
+                    verification.wikipedia_status = kg_status
+                    verification.is_wikipedia_checked = True
+                    external_checked = True
+                except Exception as e:
+                    notes.append(f"   ⚠️ Multi-KG check failed for C{i+1}: {e}")
+            # Fallback to Wikipedia if Multi-KG unavailable
+            if not external_checked and wiki_service:
+                try:
+                    wiki_status = await asyncio.to_thread(wiki_service.verify_claim_with_wikipedia, verification.claim)
+                    verification.wikipedia_status = wiki_status
+                    verification.is_wikipedia_checked = True
+                    notes.append(f"   🌐 Wikipedia fallback for C{i+1}: {wiki_status}")
+                except Exception as e:
+                    notes.append(f"   ⚠️ Wikipedia check failed for C{i+1}: {e}")
+        return notes
+    
+    return await asyncio.gather(*(check_claim(i, verification) for i, verification in enumerate(verified_claims)))
+
 def demonstrate_analysis(question):
     """
     Demonstrate the complete hallucination detection process
@@ -118,6 +155,8 @@ def demonstrate_analysis(question):
     
     # Handle separate LLM1/LLM2 results when using real APIs
     if isinstance(bulk_results, dict) and 'llm1' in bulk_results and 'llm2' in bulk_results:
+        llm1_results = bulk_results['llm1']
+        llm2_results = bulk_results['llm2']
         print("   LLM1 (Gemini) Results:")
         for i, status in enumerate(bulk_results['llm1'], 1):
             print(f"     C{i}: {status}")
@@ -128,11 +167,13 @@ def demonstrate_analysis(question):
         # Fallback for simulation mode
         for i, status in enumerate(bulk_results, 1):
             print(f"   C{i}: {status}")
+        # One batch per verifier instead of one call per claim
+        llm1_results = bulk_verify_with_llm1(claims_text)
+        llm2_results = bulk_verify_with_llm2(claims_text)
     print()
     
     # Step 3: Verify claims
     print("6️⃣ CLAIM VERIFICATION:")
-    verified_claims = []
     
     # Initialize external verification services using config flags
     wiki_service = None
@@ -153,44 +194,35 @@ def demonstrate_analysis(question):
     external_status = "Multi-KG (REAL)" if multi_kg_service else ("Wikipedia (REAL)" if (wiki_service and not wiki_service.use_simulation) else "SIM")
     print(f"   External Verifier: {external_status}")
     
-    for i, claim in enumerate(claims_text):
-        llm1_response = verify_with_llm1(claim)
-        llm2_response = verify_with_llm2(claim)
-        
-        verification = ClaimVerification(
+    # Pad missing verdicts once, then build every claim in a single comprehension
+    llm1_results = llm1_results + ["Uncertain"] * (len(claims_text) - len(llm1_results))
+    llm2_results = llm2_results + ["Uncertain"] * (len(claims_text) - len(llm2_results))
+    verified_claims = [
+        ClaimVerification.model_construct(
             id=f"C{i+1}",
             claim=claim,
             llm1_verification=llm1_response,
             llm2_verification=llm2_response
         )
+        for i, (claim, llm1_response, llm2_response) in enumerate(zip(claims_text, llm1_results, llm2_results))
+    ]
+    
+    # Check medium risk claims externally, overlapping the KG / Wikipedia requests.
+    # Claim-to-claim graph edges don't depend on those checks, so build them meanwhile
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        agreement_future = executor.submit(build_agreement_edges, verified_claims)
+        external_notes = asyncio.run(check_claims_externally(verified_claims, multi_kg_service, wiki_service))
+        agreement_edges = agreement_future.result()
+    
+    risk_counts = [0, 0, 0]  # indexed by RiskLevel
+    for i, verification in enumerate(verified_claims):
+        claim = verification.claim
+        for note in external_notes[i]:
+            print(note)
         
-        # Check if we should verify externally for medium risk claims
-        if verification.should_check_wikipedia():
-            external_checked = False
-            # Try Multi-KG consensus first (research-grade approach)
-            if multi_kg_service:
-                try:
-                    kg_status = multi_kg_service.verify_claim(claim)
-                    print(f"   � Multi-KG consensus for C{i+1}: {kg_status}")
-                    # Map Multi-KG status into wikipedia_status field to reuse existing logic
-                    verification.wikipedia_status = kg_status
-                    verification.is_wikipedia_checked = True
-                    external_checked = True
-                except Exception as e:
-                    print(f"   ⚠️ Multi-KG check failed for C{i+1}: {e}")
-            # Fallback to Wikipedia if Multi-KG unavailable
-            if not external_checked and wiki_service:
-                try:
-                    wiki_status = wiki_service.verify_claim_with_wikipedia(claim)
-                    verification.wikipedia_status = wiki_status
-                    verification.is_wikipedia_checked = True
-                    print(f"   🌐 Wikipedia fallback for C{i+1}: {wiki_status}")
-                except Exception as e:
-                    print(f"   ⚠️ Wikipedia check failed for C{i+1}: {e}")
-        
-        verified_claims.append(verification)
-        
-        risk_level = verification.get_risk_level().upper()
+        risk_index = verification.get_risk_index()
+        risk_counts[risk_index] += 1
+        risk_level = RISK_LEVEL_NAMES[risk_index].upper()
         confidence = verification.get_confidence_score()
         
         # Color coding for terminal output
@@ -202,8 +234,8 @@ def demonstrate_analysis(question):
         reset_color = "\033[0m"
         
         print(f"   C{i+1}: {claim}")
-        print(f"       LLM1: {llm1_response}")
-        print(f"       LLM2: {llm2_response}")
+        print(f"       LLM1: {verification.llm1_verification}")
+        print(f"       LLM2: {verification.llm2_verification}")
         if verification.is_wikipedia_checked:
             print(f"       Wikipedia: {verification.wikipedia_status}")
         print(f"       Risk Level: {risk_colors.get(risk_level, '❓')} {risk_level} RISK{reset_color}")
@@ -213,11 +245,7 @@ def demonstrate_analysis(question):
     # Step 4: Generate summary
     print("7️⃣ RISK ASSESSMENT SUMMARY:")
     
-    risk_counts = {"high": 0, "medium": 0, "low": 0}
-    for claim in verified_claims:
-        risk_level = claim.get_risk_level()
-        risk_counts[risk_level] += 1
-    
+    risk_counts = dict(zip(RISK_LEVEL_NAMES, risk_counts))
     total_claims = len(verified_claims)
     print(f"   Total Claims: {total_claims}")
     print(f"   🔴 High Risk: {risk_counts['high']} ({risk_counts['high']/total_claims*100:.1f}%)")
@@ -243,7 +271,7 @@ def demonstrate_analysis(question):
     
     # Step 5: Graph metrics
     print("8️⃣ GRAPH ANALYSIS:")
-    graph_data = build_hallucination_graph(verified_claims)
+    graph_data = build_hallucination_graph(verified_claims, agreement_edges)
     metrics = graph_data['metrics']
     
     print(f"   Connected Components: {metrics['connected_components']}")
@@ -330,6 +358,9 @@ if __name__ == "__main__":
     
     args = parser.parse_args()
     
+    # Config no longer prints its status on import, so the entry point does it
+    config.log_status_once()
+    
     print("🧠 HALLUCINATION DETECTION SYSTEM")
     print("Detecting potential factual errors in LLM responses")
     print()